@@ -1,23 +1,22 @@
 
 import os
 import time
+import random
 import logging
-import getpass
 import functools
-from itertools import groupby
 from dataclasses import dataclass
-from functools import singledispatch
-from collections import MutableMapping
-from typing import Iterator, overload, Union, Set, List, Callable
+from collections import MutableMapping, defaultdict, deque
+from typing import Iterator, Union, Set, List, Callable
 from bson.objectid import ObjectId
 from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure, OperationFailure, PyMongoError
 from pymongo.database import Database as MongoDatabase
 from pymongo.collection import Collection as MongoCollection
 from pymongo.results import UpdateResult
 from rez.config import config as rezconfig
 
 from .exceptions import BackendError
-from .util import elide
+from .util import elide, current_user, get_executor, SharedConnections
 from .core import SuiteTool, AbstractScope
 # Note:
 #   In case the cyclic import between this module and `.core` pops out
@@ -34,6 +33,8 @@ log = logging.getLogger("allzpark")
 
 parkconfig = rezconfig.plugins.command.park
 
+AVALON_DB = os.getenv("AVALON_DB", "avalon")
+
 
 def get_entrance(uri=None, timeout=None):
     """
@@ -55,116 +56,48 @@ MANAGER_ROLE = "admin"
 DEVELOPER_ROLE = "developer"
 
 
-class _Scope(AbstractScope):
-
-    def exists(
-            self: Union["Entrance", "Project", "Asset", "Task"]
-    ) -> bool:
-        return check_existence(self)
-
-    @overload
-    def iter_children(self: "Entrance") -> Iterator["Project"]:
-        ...
-
-    @overload
-    def iter_children(self: "Project") -> Iterator["Asset"]:
-        ...
-
-    @overload
-    def iter_children(self: "Asset") -> Iterator["Task"]:
-        ...
-
-    def iter_children(self):
-        """Iter child scopes
+def _brief_repr(scope):
+    # not recursing into upstream, for cheaper and shorter repr
+    return f"{type(scope).__name__}({scope.name})"
 
-        :type self: Entrance or Project or Asset
-        :return:
-        :rtype: Iterator[Project] or Iterator[Asset] or Iterator[Task]
-        """
-        return iter_avalon_scopes(self)
-
-    @overload
-    def suite_path(self: "Entrance") -> Union[str, None]:
-        ...
-
-    @overload
-    def suite_path(self: "Project") -> str:
-        ...
-
-    @overload
-    def suite_path(self: Union["Asset", "Task"]) -> None:
-        ...
-
-    def suite_path(self):
-        """Iter child scopes
-
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: Union[str, None]
-        """
-        return scope_suite_path(self)
 
-    def make_tool_filter(
-            self: Union["Entrance", "Project", "Asset", "Task"]
-    ) -> ToolFilterCallable:
-        """
-        :return:
-        """
-        return tool_filter_factory(self)
+class _Scope(AbstractScope):
+    __slots__ = ()
 
-    def obtain_workspace(
-            self: Union["Entrance", "Project", "Asset", "Task"],
-            tool: SuiteTool = None,
-    ) -> str:
-        """
+    def _cached_hash(self) -> int:
+        # note: subclass must have `_hash` slot. The key only contains stable
+        #   values so that the hash remains valid while other fields (e.g.
+        #   `Asset.is_leaf`, `Entrance.joined`) being changed.
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(
+                (type(self).__name__, self.name, self.upstream.name)
+            )
+            return self._hash
 
-        :param tool:
-        :type tool: SuiteTool or None
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: str or None
-        """
-        return obtain_avalon_workspace(self, tool)
+    def additional_env(self, tool: SuiteTool) -> dict:
+        environ = dict()
+        self._fill_env(tool, environ)
+        return environ
 
-    def additional_env(
-            self: Union["Entrance", "Project", "Asset", "Task"],
-            tool: SuiteTool
-    ) -> dict:
-        """
+    def _fill_env(self, tool: SuiteTool, environ: dict) -> None:
+        """Write environ of this and upstream scopes into given dict"""
+        raise NotImplementedError
 
-        :param tool:
-        :type tool: SuiteTool
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: dict
-        """
-        return avalon_pipeline_env(self, tool)
-
-    def current_user_roles(
-            self: Union["Entrance", "Project", "Asset", "Task"]
-    ) -> list:
-        """
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: list
-        """
-        return avalon_current_user_roles(self)
-
-    def generate_breadcrumb(
-            self: Union["Entrance", "Project", "Asset", "Task"]
-    ) -> dict:
-        """
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: dict
-        """
-        return generate_avalon_scope_breadcrumb(self)
+    def current_user_roles(self) -> list:
+        """Returns current user's roles in this scope"""
+        raise NotImplementedError
 
 
+# note:
+#   `__slots__` are declared by hand since `dataclass(slots=True)` requires
+#   Python 3.10+. Keep them in sync with the fields.
 @dataclass  # can't froze this, attribute 'joined' can be changed
 class Entrance(_Scope):
     name = "avalon"
     upstream = None
+    __slots__ = ("uri", "timeout", "joined", "db")
     uri: str
     timeout: int
     joined: bool
@@ -176,12 +109,59 @@ class Entrance(_Scope):
     def __hash__(self):
         return hash(repr(self))
 
+    def __post_init__(self):
+        self.db = AvalonMongo(self.uri, self.timeout, entrance=self)
+
     def get_scope_from_breadcrumb(self, breadcrumb: dict):
         return get_scope_from_breadcrumb(self, breadcrumb)
 
+    def exists(self) -> bool:
+        try:
+            ping(self.db)
+        except IOError as e:
+            log.critical(f"Avalon Database connection lost: {str(e)}")
+            return False
+        return True
+
+    def iter_children(self) -> Iterator["Project"]:
+        return iter_avalon_projects(self.db, self.joined)
+
+    def suite_path(self) -> Union[str, None]:
+        return os.getenv("AVALON_ENTRANCE_SUITE")
+
+    def make_tool_filter(self) -> ToolFilterCallable:
+        categories = frozenset({"entrance"})
+        user = current_user()
+
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and tool.ctx_category in categories
+                and (not required_roles or user in required_roles)
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> str:
+        _ = tool
+        return os.getcwd()
+
+    def _fill_env(self, tool: SuiteTool, environ: dict) -> None:
+        _ = tool, environ  # consume unused arg
+
+    def current_user_roles(self) -> list:
+        return []
+
+    def generate_breadcrumb(self) -> dict:
+        return {"entrance": self.name}
+
 
 @dataclass
 class Project(_Scope):
+    __slots__ = (
+        "name", "upstream", "is_active", "roles", "tasks", "root",
+        "username", "work_template", "coll", "db", "cacheRoot", "_hash",
+    )
     name: str
     upstream: Entrance
     is_active: bool
@@ -195,14 +175,69 @@ class Project(_Scope):
     cacheRoot: str
 
     def __repr__(self):
-        return f"Project(name={self.name}, upstream={self.upstream})"
+        return f"Project(name={self.name}, " \
+               f"upstream={_brief_repr(self.upstream)})"
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._cached_hash()
+
+    def exists(self) -> bool:
+        return self.db.is_project_exists(self.coll)
+
+    def iter_children(self) -> Iterator["Asset"]:
+        return iter_avalon_assets(self)
+
+    def suite_path(self) -> str:
+        return _project_suite_path(self.name)
+
+    def make_tool_filter(self) -> ToolFilterCallable:
+        categories = frozenset({"project", "entrance"})
+        roles = self.roles
+
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and tool.ctx_category in categories
+                and (not required_roles
+                     or not roles.isdisjoint(required_roles))
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> str:
+        _ = tool
+        template = "{root}/{project}/Avalon"
+        path = template.format(**{
+            "root": self.root,
+            "project": self.name,
+        })
+        return os.path.normpath(path).replace('\\', '/')
+
+    def _fill_env(self, tool: SuiteTool, environ: dict) -> None:
+        self.upstream._fill_env(tool, environ)
+        environ["AVALON_PROJECTS"] = self.root
+        environ["AVALON_PROJECT"] = self.name
+        environ["AVALON_APP"] = tool.name
+        environ["AVALON_APP_NAME"] = tool.name  # application dir
+        environ["AVALON_CACHE_ROOT"] = self.cacheRoot
+
+    def current_user_roles(self) -> list:
+        return self.roles
+
+    def generate_breadcrumb(self) -> dict:
+        breadcrumb = self.upstream.generate_breadcrumb()
+        breadcrumb.update({"project": self.coll})
+        return breadcrumb
 
 
 @dataclass
 class Asset(_Scope):
+    __slots__ = (
+        "name", "label", "upstream", "project", "parent", "silo", "episode",
+        "sequence", "asset_type", "tasks", "is_silo", "is_episode",
+        "is_sequence", "is_asset_type", "is_leaf", "is_hidden", "child_task",
+        "coll", "db", "_hash",
+    )
     name: str
     label: str
     upstream: Project
@@ -225,14 +260,67 @@ class Asset(_Scope):
 
     def __repr__(self):
         return f"Asset(name={self.name}, label={self.label}, " \
-               f"upstream={self.upstream})"
+               f"upstream={_brief_repr(self.upstream)})"
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._cached_hash()
+
+    def exists(self) -> bool:
+        return self.db.is_asset_exists(self.coll, self.name)
+
+    def iter_children(self) -> Iterator["Task"]:
+        return iter_avalon_tasks(self)
+
+    def suite_path(self) -> None:
+        return None
+
+    def make_tool_filter(self) -> ToolFilterCallable:
+        categories = frozenset({"asset", "project", "entrance"})
+        roles = self.project.roles
+
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and tool.ctx_category in categories
+                and (not required_roles
+                     or not roles.isdisjoint(required_roles))
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> str:
+        _ = tool
+        template = "{root}/{project}/Avalon"
+        path = template.format(**{
+            "root": self.project.root,
+            "project": self.project.name,
+        })
+        return os.path.normpath(path).replace('\\', '/')
+
+    def _fill_env(self, tool: SuiteTool, environ: dict) -> None:
+        self.upstream._fill_env(tool, environ)
+        environ["AVALON_SILO"] = self.silo
+        environ["AVALON_EPISODE"] = self.episode
+        environ["AVALON_SEQUENCE"] = self.sequence
+        environ["AVALON_ASSET_TYPE"] = self.asset_type
+        environ["AVALON_ASSET"] = self.name
+        environ["AVALON_APP"] = tool.name
+        environ["AVALON_APP_NAME"] = tool.name  # application dir
+
+    def current_user_roles(self) -> list:
+        return self.upstream.current_user_roles()
+
+    def generate_breadcrumb(self) -> dict:
+        breadcrumb = self.upstream.generate_breadcrumb()
+        breadcrumb.update({"asset": self.name})
+        return breadcrumb
 
 
 @dataclass
 class Task(_Scope):
+    __slots__ = (
+        "name", "upstream", "project", "asset", "coll", "db", "_hash",
+    )
     name: str
     upstream: Asset
     project: Project
@@ -241,303 +329,103 @@ class Task(_Scope):
     db: "AvalonMongo"
 
     def __repr__(self):
-        return f"Task(name={self.name}, upstream={self.upstream})"
+        return f"Task(name={self.name}, " \
+               f"upstream={_brief_repr(self.upstream)})"
 
     def __hash__(self):
-        return hash(repr(self))
-
-
-@singledispatch
-def iter_avalon_scopes(scope):
-    """Iter Avalon projects/assets/tasks
-
-    :param scope: The scope of workspace. Could be a project/asset/task.
-    :type scope: Entrance or Project or Asset
-    :rtype: Iterator[Project] or Iterator[Asset] or Iterator[Task] or None
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@iter_avalon_scopes.register
-def _(scope: Entrance) -> Iterator[Project]:
-    database = AvalonMongo(scope.uri, scope.timeout, entrance=scope)
-    return iter_avalon_projects(database, scope.joined)
-
-
-@iter_avalon_scopes.register
-def _(scope: Project) -> Iterator[Asset]:
-    return iter_avalon_assets(scope)
-
-
-@iter_avalon_scopes.register
-def _(scope: Asset) -> Iterator[Task]:
-    return iter_avalon_tasks(scope)
-
+        return self._cached_hash()
 
-@iter_avalon_scopes.register
-def _(scope: Task) -> tuple:
-    log.debug(f"Endpoint reached: {elide(scope)}")
-    return ()
+    def exists(self) -> bool:
+        return True
 
+    def iter_children(self) -> tuple:
+        log.debug(f"Endpoint reached: {elide(self)}")
+        return ()
 
-@singledispatch
-def tool_filter_factory(scope) -> ToolFilterCallable:
-    """
-
-    :param scope: The scope of workspace. Could be a project/asset/task.
-    :type scope: Entrance or Project or Asset or Task
-    :return: A callable filter function
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@tool_filter_factory.register
-def _(scope: Entrance) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        ctx_category = tool.ctx_name.split(".", 1)[0]
-        categories = {"entrance"}
-        return (
-            not tool.metadata.hidden
-            and ctx_category in categories
-            and (not required_roles
-                 or getpass.getuser() in required_roles)
-        )
-    _ = scope  # consume unused arg
-    return _filter
-
-
-@tool_filter_factory.register
-def _(scope: Project) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        ctx_category = tool.ctx_name.split(".", 1)[0]
-        categories = {"project", "entrance"}
-        return (
-            not tool.metadata.hidden
-            and ctx_category in categories
-            and (not required_roles
-                 or scope.roles.intersection(required_roles))
-        )
-    return _filter
-
-
-@tool_filter_factory.register
-def _(scope: Asset) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        ctx_category = tool.ctx_name.split(".", 1)[0]
-        categories = {"asset", "project", "entrance"}
-        return (
-            not tool.metadata.hidden
-            and ctx_category in categories
-            and (not required_roles
-                 or scope.project.roles.intersection(required_roles))
-        )
-    return _filter
+    def suite_path(self) -> None:
+        return None
 
+    def make_tool_filter(self) -> ToolFilterCallable:
+        roles = self.project.roles
 
-@tool_filter_factory.register
-def _(scope: Task) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        return (
-            not tool.metadata.hidden
-            and (not required_roles
-                 or scope.project.roles.intersection(required_roles))
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and (not required_roles
+                     or not roles.isdisjoint(required_roles))
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> str:
+        project, asset = self.project, self.asset
+        return _format_task_workspace(
+            project.work_template,
+            tool.name if tool else None,
+            project.root,
+            project.name,
+            asset.silo,
+            asset.episode,
+            asset.sequence,
+            asset.asset_type,
+            asset.name,
+            self.name,
+            project.username,
         )
-    return _filter
-
-
-@singledispatch
-def obtain_avalon_workspace(scope, tool=None):
-    """
-
-    :param scope: The scope of workspace. Could be at project/asset/task.
-    :param tool: A tool provided by Rez suite.
-    :type scope: Entrance or Project or Asset or Task
-    :type tool: SuiteTool or None
-    :return: A filesystem path to workspace if available
-    :rtype: str or None
-    """
-    _ = tool  # consume unused arg
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
 
-@obtain_avalon_workspace.register
-def _(scope: Entrance, tool: SuiteTool = None) -> str:
-    _ = scope, tool
-    return os.getcwd()
+    def _fill_env(self, tool: SuiteTool, environ: dict) -> None:
+        self.upstream._fill_env(tool, environ)
+        environ["AVALON_TASK"] = self.name
+        environ["AVALON_WORKDIR"] = self.obtain_workspace(tool)
+        environ["AVALON_APP"] = tool.name
+        environ["AVALON_APP_NAME"] = tool.name  # application dir
+        environ["REZ_ALIAS_NAME"] = tool.alias
 
+    def current_user_roles(self) -> list:
+        return self.upstream.current_user_roles()
 
-@obtain_avalon_workspace.register
-def _(scope: Project, tool: SuiteTool = None) -> str:
-    _ = tool
-    template = "{root}/{project}/Avalon"
-    path = template.format(**{
-        "root": scope.root,
-        "project": scope.name,
-    })
-    return os.path.normpath(path).replace('\\', '/')
-
+    def generate_breadcrumb(self) -> dict:
+        breadcrumb = self.upstream.generate_breadcrumb()
+        breadcrumb.update({"task": self.name})
+        return breadcrumb
 
-@obtain_avalon_workspace.register
-def _(scope: Asset, tool: SuiteTool = None) -> str:
-    _ = tool
-    template = "{root}/{project}/Avalon"
-    path = template.format(**{
-        "root": scope.project.root,
-        "project": scope.project.name,
-    })
-    return os.path.normpath(path).replace('\\', '/')
 
+@functools.lru_cache(maxsize=4096)
+def _format_task_workspace(template, app, root, project, silo, episode,
+                           sequence, asset_type, asset, task, user):
+    """Format task workspace path from project work template
 
-@obtain_avalon_workspace.register
-def _(scope: Task, tool: SuiteTool = None) -> str:
-    task = scope
-    template = task.project.work_template
-    if tool is None:
+    All arguments are str (or None), so the result is memoized, e.g. for
+    obtaining the workspace and then again for the environ on tool launch.
+    If `app` is None, the path is cut before the "{app}" placeholder.
+    """
+    if app is None:
         template = template.split("{app}")[0]
 
-    if task.asset.silo == "Assets":
+    if silo == "Assets":
         template = template.replace("{category}", "{asset_type}")
-    elif task.asset.silo == "Shots":
+    elif silo == "Shots":
         template = template.replace("{category}", "{episode}/{sequence}")
     else:
         template = template.replace("{category}", "")
 
     path = template.format(**{
-        "root": task.project.root,
-        "project": task.project.name,
-        "silo": task.asset.silo,
-        "episode": task.asset.episode,
-        "sequence": task.asset.sequence,
-        "asset_type": task.asset.asset_type,
-        "asset": task.asset.name,
-        "task": task.name,
-        "app": tool.name if tool else "",
-        "user": task.project.username,
+        "root": root,
+        "project": project,
+        "silo": silo,
+        "episode": episode,
+        "sequence": sequence,
+        "asset_type": asset_type,
+        "asset": asset,
+        "task": task,
+        "app": app or "",
+        "user": user,
     })
     return os.path.normpath(path).replace('\\', '/')
 
 
-@singledispatch
-def avalon_pipeline_env(scope, tool):
-    """
-
-    :param scope: The scope of workspace. Could be at project/asset/task.
-    :param tool: A tool provided by from Rez suite.
-    :type scope: Entrance or Project or Asset or Task
-    :type tool: SuiteTool
-    :return:
-    :rtype: dict
-    """
-    _ = tool  # consume unused arg
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@avalon_pipeline_env.register
-def _(scope: Entrance, tool: SuiteTool) -> dict:
-    _ = scope, tool  # consume unused arg
-    return {}
-
-
-@avalon_pipeline_env.register
-def _(scope: Project, tool: SuiteTool) -> dict:
-    project = scope
-    environ = scope.upstream.additional_env(tool)
-    environ.update({
-        "AVALON_PROJECTS": project.root,
-        "AVALON_PROJECT": project.name,
-        "AVALON_APP": tool.name,
-        "AVALON_APP_NAME": tool.name,  # application dir
-        "AVALON_CACHE_ROOT": project.cacheRoot
-    })
-    return environ
-
-
-@avalon_pipeline_env.register
-def _(scope: Asset, tool: SuiteTool) -> dict:
-    asset = scope
-    environ = scope.upstream.additional_env(tool)
-    environ.update({
-        "AVALON_SILO": asset.silo,
-        "AVALON_EPISODE": asset.episode,
-        "AVALON_SEQUENCE": asset.sequence,
-        "AVALON_ASSET_TYPE": asset.asset_type,
-        "AVALON_ASSET": asset.name,
-        "AVALON_APP": tool.name,
-        "AVALON_APP_NAME": tool.name,  # application dir
-    })
-    return environ
-
-
-@avalon_pipeline_env.register
-def _(scope: Task, tool: SuiteTool) -> dict:
-    task = scope
-    environ = scope.upstream.additional_env(tool)
-    environ.update({
-        "AVALON_TASK": task.name,
-        "AVALON_WORKDIR": obtain_avalon_workspace(task, tool),
-        "AVALON_APP": tool.name,
-        "AVALON_APP_NAME": tool.name,  # application dir
-        "REZ_ALIAS_NAME": tool.alias
-    })
-    return environ
-
-@singledispatch
-def avalon_current_user_roles(scope):
-    """
-
-    :param scope: The scope of workspace. Could be at project/asset/task.
-    :type scope: Entrance or Project or Asset or Task
-    :return:
-    :rtype: list
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@avalon_current_user_roles.register
-def _(scope: Entrance) -> list:
-    _ = scope
-    return []
-
-
-@avalon_current_user_roles.register
-def _(scope: Project) -> list:
-    return scope.roles
-
-
-@avalon_current_user_roles.register
-def _(scope: Asset) -> list:
-    return scope.upstream.current_user_roles()
-
-
-@avalon_current_user_roles.register
-def _(scope: Task) -> list:
-    return scope.upstream.current_user_roles()
-
-
-@singledispatch
-def scope_suite_path(scope):
-    """
-
-    :param scope: The scope of workspace. Could be at project/asset/task.
-    :type scope: Entrance or Project or Asset or Task
-    :return: A filesystem path to workspace if available
-    :rtype: str or None
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@scope_suite_path.register
-def _(scope: Entrance) -> Union[str, None]:
-    _ = scope
-    return os.getenv("AVALON_ENTRANCE_SUITE")
-
-
-@scope_suite_path.register
-def _(scope: Project) -> str:
+@functools.lru_cache(maxsize=1)
+def _avalon_suite_root():
     roots = parkconfig.suite_roots  # type: dict
     if not isinstance(roots, MutableMapping):
         raise BackendError("Invalid configuration, 'suite_roots' should be "
@@ -547,101 +435,19 @@ def _(scope: Project) -> str:
     if not avalon_suite_root:
         raise BackendError("Invalid configuration, no suite root for Avalon")
 
-    return os.path.join(avalon_suite_root, scope.name)
-
-
-@scope_suite_path.register
-def _(scope: Asset) -> None:
-    _ = scope
-    return None
-
-
-@scope_suite_path.register
-def _(scope: Task) -> None:
-    _ = scope
-    return None
-
-
-@singledispatch
-def check_existence(scope) -> bool:
-    """Check if the scope still valid in Avalon database
-
-    :param scope: The scope of workspace. Could be a project/asset/task.
-    :type scope: Entrance or Project or Asset
-    :rtype: Iterator[Project] or Iterator[Asset] or Iterator[Task] or None
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@check_existence.register
-def _(scope: Entrance) -> bool:
-    try:
-        ping(AvalonMongo(scope.uri, scope.timeout, entrance=scope))
-    except IOError as e:
-        log.critical(f"Avalon Database connection lost: {str(e)}")
-        return False
-    return True
-
-
-@check_existence.register
-def _(scope: Project) -> bool:
-    return scope.db.is_project_exists(scope.coll)
-
-
-@check_existence.register
-def _(scope: Asset) -> bool:
-    return scope.db.is_asset_exists(scope.coll, scope.name)
+    return avalon_suite_root
 
 
-@check_existence.register
-def _(scope: Task) -> bool:
-    _ = scope
-    return True
-
-
-@singledispatch
-def generate_avalon_scope_breadcrumb(scope):
-    """
-
-    :param scope: The scope of workspace. Could be at project/asset/task.
-    :type scope: Entrance or Project or Asset or Task
-    :return:
-    :rtype: dict
-    """
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@generate_avalon_scope_breadcrumb.register
-def _(scope: Entrance) -> dict:
-    return {"entrance": scope.name}
-
-
-@generate_avalon_scope_breadcrumb.register
-def _(scope: Project) -> dict:
-    breadcrumb = scope.upstream.generate_breadcrumb()
-    breadcrumb.update({"project": scope.coll})
-    return breadcrumb
-
-
-@generate_avalon_scope_breadcrumb.register
-def _(scope: Asset) -> dict:
-    breadcrumb = scope.upstream.generate_breadcrumb()
-    breadcrumb.update({"asset": scope.name})
-    return breadcrumb
-
-
-@generate_avalon_scope_breadcrumb.register
-def _(scope: Task) -> dict:
-    breadcrumb = scope.upstream.generate_breadcrumb()
-    breadcrumb.update({"task": scope.name})
-    return breadcrumb
+@functools.lru_cache(maxsize=None)
+def _project_suite_path(project_name):
+    return os.path.join(_avalon_suite_root(), project_name)
 
 
 def get_scope_from_breadcrumb(entrance: Entrance, breadcrumb: dict):
 
     if "project" in breadcrumb:
         coll_name = breadcrumb["project"]
-        db = AvalonMongo(entrance.uri, entrance.timeout, entrance=entrance)
+        db = entrance.db
         doc = db.find_project(coll_name)
         if doc:
             log.debug(f"Found avalon project: {coll_name}")
@@ -654,8 +460,12 @@ def get_scope_from_breadcrumb(entrance: Entrance, breadcrumb: dict):
 
     if "asset" in breadcrumb:
         asset_name = breadcrumb["asset"]
-        asset = next(
-            # so to get a full asset hierarchy, and it's hidden state
+        asset_doc = project.db.find_asset_doc(project.coll, asset_name)
+        if asset_doc is None:
+            log.debug(f"Avalon asset not found: {asset_name}")
+            return
+        asset = _find_asset_scope(project, asset_doc) or next(
+            # parent chain not resolvable, walk the full asset hierarchy
             (a for a in project.iter_children() if a.name == asset_name), None
         )
         if asset is None:
@@ -693,23 +503,16 @@ def _mk_project_scope(coll_name, doc, database, active_only=True):
     if active_only and not is_active:
         return
 
-    username = getpass.getuser()
+    username = current_user()
     project_root = doc["data"]["root"]
 
-    roles = set()
-    _role_book = doc["data"].get("role", {})
-    if username in _role_book.get(MEMBER_ROLE, []):
-        roles.add(MEMBER_ROLE)
-    if username in _role_book.get(MANAGER_ROLE, []):
-        roles.add(MANAGER_ROLE)
-    if username in _role_book.get(DEVELOPER_ROLE, []):
-        roles.add(DEVELOPER_ROLE)
-
-    tasks = []
-    for task in doc["config"]["tasks"]:
-        if task["name"] not in tasks:
-            tasks.append(task["name"])
-    tasks.sort()
+    _role_book = doc["data"].get("role") or {}
+    roles = {
+        role for role in (MEMBER_ROLE, MANAGER_ROLE, DEVELOPER_ROLE)
+        if username in (_role_book.get(role) or ())
+    }
+
+    tasks = sorted({task["name"] for task in doc["config"]["tasks"]})
 
     cache_root = doc["data"].get("cacheRoot", project_root)
 
@@ -737,7 +540,7 @@ def iter_avalon_projects(database, joined=True, active_only=True):
     :return: Project item iterator
     :rtype: Iterator[Project]
     """
-    for coll_name, doc in database.iter_projects(joined):
+    for coll_name, doc in database.iter_projects(joined, active_only):
         scope = _mk_project_scope(coll_name, doc, database, active_only)
         if scope is not None:
             yield scope
@@ -754,78 +557,125 @@ def iter_avalon_assets(avalon_project):
     :rtype: Iterator[Asset]
     """
     this = avalon_project
-    grouped_assets = this.db.list_assets(this.coll)
-
-    _silos = dict()
-    for depth, key, assets in grouped_assets:
-        if not isinstance(key, str):
-            continue  #
-        _hidden = this.db.get_silo_hidden(this.coll, key)
-        silo = Asset(
-            name=key,
-            label=key,
-            upstream=this,
-            project=this,
-            parent=None,
-            silo="",
-            episode="",
-            sequence="",
-            asset_type="",
-            tasks=[],
-            is_silo=True,
-            is_episode=False,
-            is_sequence=False,
-            is_asset_type=False,
-            is_hidden=_hidden,
-            is_leaf=False,
-            child_task=set(),
-            coll=this.coll,
-            db=this.db,
-        )
-        _silos[key] = silo
+    children, silo_hidden = this.db.list_assets(this.coll)
+
+    _parents = dict()
+    queue = deque()
+    for key in sorted(k for k in children if isinstance(k, str)):
+        _hidden = silo_hidden.get(key, False)
+        silo = _mk_silo_scope(key, this, _hidden)
+        _parents[key] = silo
+        queue.append(key)
 
         yield silo
 
-    _assets = dict()
-    for depth, key, assets in grouped_assets:
-        for doc in assets:
-            _parent = _assets[key] if depth else _silos[key]
-            _hidden = _parent.is_hidden or bool(doc["data"].get("trash"))
-            _is_episode = doc["type"] == "episode"
-            _episode = doc["name"] if _is_episode else _parent.episode
-            _is_sequence = doc["type"] == "sequence"
-            _sequence = doc["name"] if _is_sequence else _parent.sequence
-            _is_asset_type = doc["type"] == "asset_type"
-            _asset_type = doc["name"] if _is_asset_type else _parent.asset_type
-            tasks = doc["data"].get("tasks") or []
-            asset = Asset(
-                name=doc["name"],
-                label=doc["data"]['label'],
-                upstream=this,
-                project=this,
-                parent=_parent,
-                silo=doc.get("silo"),
-                episode=_episode,
-                sequence=_sequence,
-                asset_type=_asset_type,
-                tasks=tasks,
-                is_silo=False,
-                is_episode=_is_episode,
-                is_sequence=_is_sequence,
-                is_asset_type=_is_asset_type,
-                is_leaf=True,
-                is_hidden=_hidden,
-                child_task=set(),
-                coll=this.coll,
-                db=this.db,
-            )
-            _parent.is_leaf = False
-            _parent.child_task.update(tasks)
-            _assets[doc["_id"]] = asset
+    while queue:
+        key = queue.popleft()
+        for doc in children.get(key, ()):
+            asset = _mk_asset_scope(doc, this, _parents[key])
+            _parents[doc["_id"]] = asset
+            queue.append(doc["_id"])
 
             yield asset
 
 
+def _find_asset_scope(avalon_project, asset_doc):
+    """Get asset by querying only the asset's visual parents and children
+
+    :param avalon_project: A Project item that sourced from Avalon
+    :param dict asset_doc: Asset doc that returned from `find_asset_doc`
+    :type avalon_project: Project
+    :return: Asset item, or None if not able to resolve the hierarchy
+    :rtype: Asset or None
+    """
+    this = avalon_project
+    doc = asset_doc
+    lineage = [doc]
+    while True:
+        doc = this.db.find_visual_parent(this.coll, doc)
+        if doc is None:
+            break
+        if any(d["_id"] == doc["_id"] for d in lineage):
+            return  # cyclic hierarchy
+        lineage.insert(0, doc)
+
+    silo_name = lineage[0].get("silo")
+    if not isinstance(silo_name, str):
+        return
+
+    _hidden = this.db.get_silo_hidden(this.coll, silo_name)
+    asset = _mk_silo_scope(silo_name, this, _hidden)
+    for doc in lineage:
+        asset = _mk_asset_scope(doc, this, asset)
+
+    # same leaf state and child tasks as the one from `iter_avalon_assets`
+    for child in this.db.find_child_asset_docs(this.coll, asset_doc["_id"]):
+        asset.is_leaf = False
+        asset.child_task.update(child["data"].get("tasks") or [])
+
+    return asset
+
+
+def _mk_silo_scope(silo_name, project, is_hidden):
+    return Asset(
+        name=silo_name,
+        label=silo_name,
+        upstream=project,
+        project=project,
+        parent=None,
+        silo="",
+        episode="",
+        sequence="",
+        asset_type="",
+        tasks=[],
+        is_silo=True,
+        is_episode=False,
+        is_sequence=False,
+        is_asset_type=False,
+        is_hidden=is_hidden,
+        is_leaf=False,
+        child_task=set(),
+        coll=project.coll,
+        db=project.db,
+    )
+
+
+def _mk_asset_scope(doc, project, parent):
+    _hidden = parent.is_hidden or bool(doc["data"].get("trash"))
+    _is_episode = doc["type"] == "episode"
+    _episode = doc["name"] if _is_episode else parent.episode
+    _is_sequence = doc["type"] == "sequence"
+    _sequence = doc["name"] if _is_sequence else parent.sequence
+    _is_asset_type = doc["type"] == "asset_type"
+    _asset_type = doc["name"] if _is_asset_type else parent.asset_type
+    tasks = doc["data"].get("tasks") or []
+    asset = Asset(
+        name=doc["name"],
+        label=doc["data"]['label'],
+        upstream=project,
+        project=project,
+        parent=parent,
+        silo=doc.get("silo"),
+        episode=_episode,
+        sequence=_sequence,
+        asset_type=_asset_type,
+        tasks=tasks,
+        is_silo=False,
+        is_episode=_is_episode,
+        is_sequence=_is_sequence,
+        is_asset_type=_is_asset_type,
+        is_leaf=True,
+        is_hidden=_hidden,
+        child_task=set(),
+        coll=project.coll,
+        db=project.db,
+    )
+    parent.is_leaf = False
+    parent.child_task.update(tasks)
+
+    return asset
+
+
 def iter_avalon_tasks(avalon_asset):
     """Iter tasks in specific asset
 
@@ -849,9 +699,41 @@ def iter_avalon_tasks(avalon_asset):
         )
 
 
-@functools.lru_cache(maxsize=None)
+_ASSET_TYPES = ["asset", "episode", "sequence", "asset_type"]
+# docs per cursor batch. MongoDB returns 101 docs in the first batch by
+# default and then up to 16 MiB per getMore. Asset docs are tiny with the
+# projection below, so one large batch fetches most projects in a single
+# round trip while a batch still stays far below the 16 MiB cap.
+_ASSET_BATCH_SIZE = 10000
+_ASSET_PROJECTION = {
+    "name": True,
+    "type": True,
+    "silo": True,
+    "data.trash": True,
+    "data.tasks": True,
+    "data.visualParent": True,
+    "data.label": True
+}
+
+
+_clients = SharedConnections(
+    # key: (pid, uri, timeout)
+    connect=lambda key: MongoClient(key[1], serverSelectionTimeoutMS=key[2]),
+    close=MongoClient.close,
+)
+
+
 def _get_connection(uri, timeout):
-    return MongoClient(uri, serverSelectionTimeoutMS=timeout)
+    """Returns a MongoClient that is shared by all AvalonMongo instances
+
+    Clients are also keyed by process id, MongoClient is not fork-safe.
+    """
+    return _clients.get((os.getpid(), uri, timeout))
+
+
+def close_all():
+    """Close all shared MongoClient"""
+    _clients.close_all()
 
 
 class AvalonMongo(object):
@@ -871,35 +753,51 @@ class AvalonMongo(object):
         self.conn = conn
         self.timeout = timeout
         self.entrance = entrance
-        self._db_name = os.getenv("AVALON_DB", "avalon")
+        self._db_name = AVALON_DB
+        self._db = conn[self._db_name]  # type: MongoDatabase
+        self._colls = dict()  # type: dict[str, MongoCollection]
+        self._union_supported = None  # `$unionWith` requires MongoDB 4.4+
+
+    def _coll(self, coll_name):
+        """Returns cached collection handle
+        :rtype: MongoCollection
+        """
+        try:
+            return self._colls[coll_name]
+        except KeyError:
+            coll = self._colls[coll_name] = self._db.get_collection(coll_name)
+            return coll
 
     def is_project_exists(self, coll_name):
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
+        coll = self._coll(coll_name)
         return bool(
             coll.find_one({"type": "project"},
                           projection={"_id": True})
         )
 
     def is_asset_exists(self, coll_name, asset_name):
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
+        coll = self._coll(coll_name)
         return bool(
             coll.find_one({"type": "asset", "name": asset_name},
                           projection={"_id": True})
         )
 
-    def find_project(self, coll_name, joined=True):
-        _user = getpass.getuser()
-        db = self.conn[self._db_name]  # type: MongoDatabase
-
-        _projection = {
-            "type": True,
-            "name": True,
-            "data": True,
-            "config.tasks.name": True,
-            "config.template.work": True,
-        }
+    # only fields that _mk_project_scope reads, project `data` may
+    # carry large embedded configs that we don't need here.
+    _project_projection = {
+        "type": True,
+        "name": True,
+        "data.active": True,
+        "data.root": True,
+        "data.role": True,
+        "data.cacheRoot": True,
+        "config.tasks.name": True,
+        "config.template.work": True,
+    }
+
+    @staticmethod
+    def _project_filter(joined=True, active_only=False):
+        _user = current_user()
         query_filter = {
             "type": "project",
             "name": {"$exists": 1},
@@ -908,102 +806,192 @@ class AvalonMongo(object):
             query_filter.update({
                 f"data.role.{MEMBER_ROLE}": _user if joined else {"$ne": _user}
             })
-        coll = db.get_collection(coll_name)  # type: MongoCollection
-        return coll.find_one(query_filter, projection=_projection)
+        if active_only:
+            # skip inactive project server-side, missing flag means active
+            query_filter["$or"] = [
+                {"data.active": {"$exists": False}},
+                {"data.active": {"$nin": [False, 0, None, ""]}},
+            ]
+        return query_filter
+
+    def find_project(self, coll_name, joined=True, active_only=False):
+        coll = self._coll(coll_name)
+        return coll.find_one(self._project_filter(joined, active_only),
+                             projection=self._project_projection)
+
+    def _union_find_projects(self, names, joined=True, active_only=False):
+        """Find project doc from all collections in one aggregation
+
+        :param list[str] names: Collection names, must not be empty
+        :param bool joined:
+        :param bool active_only:
+        :return: A dict of collection name and project doc
+        :rtype: dict[str, dict]
+        :raises OperationFailure: If server doesn't support `$unionWith`
+        """
+        query_filter = self._project_filter(joined, active_only)
+
+        def _pipeline(_name):
+            return [
+                {"$match": query_filter},
+                {"$limit": 1},
+                {"$project": self._project_projection},
+                {"$addFields": {"_coll": _name}},
+            ]
+
+        first, others = names[0], names[1:]
+        pipeline = _pipeline(first) + [
+            {"$unionWith": {"coll": name, "pipeline": _pipeline(name)}}
+            for name in others
+        ]
+        cursor = self._coll(first).aggregate(
+            pipeline, batchSize=len(names)
+        )
+        return {doc.pop("_coll"): doc for doc in cursor}
 
-    def iter_projects(self, joined=True):
+    def iter_projects(self, joined=True, active_only=False):
         """
+        :param bool joined: Only projects that current user is a member of
+            if True, or not a member of if False. All projects if None.
+        :param bool active_only: Only active projects
         :return: yielding tuples of mongodb collection name and project doc
         :rtype: tuple[str, dict]
         """
-        db = self.conn[self._db_name]  # type: MongoDatabase
         f = {"name": {"$regex": r"^(?!system\.)"}}  # non-system only
 
-        for name in sorted(db.list_collection_names(filter=f)):
-            doc = self.find_project(name, joined)
+        names = sorted(self._db.list_collection_names(filter=f))
+        if not names:
+            return
+
+        # one aggregation across all collections if the server supports it
+        if self._union_supported is not False:
+            try:
+                found = self._union_find_projects(names, joined, active_only)
+            except OperationFailure as e:
+                log.debug(f"Fallback to per-collection project query: {e}")
+                self._union_supported = False
+            else:
+                self._union_supported = True
+                for name in names:
+                    doc = found.get(name)
+                    if doc:
+                        yield name, doc
+                return
+
+        # one find_one per collection, run them concurrently. MongoClient is
+        # thread-safe and results are still yielded in sorted order.
+        docs = get_executor().map(
+            functools.partial(self.find_project,
+                              joined=joined,
+                              active_only=active_only),
+            names
+        )
+        for name, doc in zip(names, docs):
             if doc:
                 yield name, doc
 
     def list_assets(self, coll_name):  # todo: lur cache this
-        """Listing assets in breadth first manner
+        """Listing assets bucketed by their parent
+
+        This returns a dict of asset docs grouped by their parent, which is
+        the asset's visual parent (`ObjectId`), or the asset's silo (str or
+        None) if that asset has no (existing) visual parent.
 
-        This returns a depth sorted list of tuple that holds grouped assets:
-            1. depth-level (int)
-            2. asset's visual parent (could be `ObjectId` or str if the
-                parent is a silo, or None if that asset has no visual parent)
-            3. list of asset doc that are in same depth and parent (list[dict])
+        And a dict of silo name and its hidden (trashed) state.
 
         :param str coll_name: Avalon project collection name
-        :rtype: list[tuple[int, Union[ObjectId, str, None], list[dict]]]
+        :rtype: tuple[
+            dict[Union[ObjectId, str, None], list[dict]],
+            dict[str, bool]
+        ]
         """
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
-
-        _projection = {
-            "name": True,
-            "type": True,
-            "silo": True,
-            "data.trash": True,
-            "data.tasks": True,
-            "data.visualParent": True,
-            "data.label": True
+        coll = self._coll(coll_name)
+
+        # one round trip for all asset-like docs and silos
+        docs_by_type = {t: [] for t in _ASSET_TYPES}
+        silos = dict()
+        cursor = coll.find(
+            {"type": {"$in": _ASSET_TYPES + ["silo"]},
+             "name": {"$exists": 1}},
+            projection=_ASSET_PROJECTION
+        ).batch_size(_ASSET_BATCH_SIZE)
+        for doc in cursor:
+            if doc["type"] == "silo":
+                _hidden = doc.get("data", {}).get("trash", False)
+                silos.setdefault(doc["name"], _hidden)
+            else:
+                docs_by_type[doc["type"]].append(doc)
+
+        _assets = sorted(docs_by_type["asset"],
+                         key=lambda d: d['data']['label'])
+        _episodes = sorted(docs_by_type["episode"],
+                           key=lambda d: d['name'])
+        _sequences = sorted(docs_by_type["sequence"],
+                            key=lambda d: d['name'])
+        _asset_types = sorted(docs_by_type["asset_type"],
+                              key=lambda d: d['name'])
+
+        all_asset_docs = {
+            d["_id"]: d
+            for d in _assets + _episodes + _sequences + _asset_types
         }
 
-        _assets = coll.find(
-            {"type": "asset", "name": {"$exists": 1}},
-            projection=_projection
-        )
-        _assets = sorted(_assets, key=lambda d: d['data']['label'])
+        # one pass bucketing, top level assets are bucketed by silo
+        children = defaultdict(list)
+        for doc in all_asset_docs.values():
+            parent = doc["data"].get("visualParent")
+            if parent is None or parent not in all_asset_docs:
+                parent = doc.get("silo")
+            children[parent].append(doc)
+
+        return children, silos
 
-        _episodes = coll.find(
-            {"type": "episode", "name": {"$exists": 1}},
-            projection=_projection
+    def find_asset_doc(self, coll_name, asset_name):
+        """Find one asset (or episode, sequence, asset_type) doc by name
+
+        :param str coll_name: Avalon project collection name
+        :param str asset_name: Asset name
+        :rtype: dict or None
+        """
+        coll = self._coll(coll_name)
+        return coll.find_one(
+            {"type": {"$in": _ASSET_TYPES}, "name": asset_name},
+            projection=_ASSET_PROJECTION
         )
-        _episodes = sorted(_episodes, key=lambda d: d['name'])
 
-        _sequences = coll.find(
-            {"type": "sequence", "name": {"$exists": 1}},
-            projection=_projection
+    def find_visual_parent(self, coll_name, asset_doc):
+        """Find the visual parent doc of given asset doc
+
+        :param str coll_name: Avalon project collection name
+        :param dict asset_doc: Asset doc that returned from `find_asset_doc`
+        :rtype: dict or None
+        """
+        parent = asset_doc["data"].get("visualParent")
+        if parent is None:
+            return
+        coll = self._coll(coll_name)
+        return coll.find_one(
+            {"_id": parent, "type": {"$in": _ASSET_TYPES}},
+            projection=_ASSET_PROJECTION
         )
-        _sequences = sorted(_sequences, key=lambda d: d['name'])
 
-        _asset_types = coll.find(
-            {"type": "asset_type", "name": {"$exists": 1}},
-            projection=_projection
+    def find_child_asset_docs(self, coll_name, asset_id):
+        """Find asset docs that have given asset as visual parent
+
+        :param str coll_name: Avalon project collection name
+        :param ObjectId asset_id: Parent asset doc id
+        :rtype: Iterator[dict]
+        """
+        coll = self._coll(coll_name)
+        return coll.find(
+            {"type": {"$in": _ASSET_TYPES},
+             "name": {"$exists": 1},
+             "data.visualParent": asset_id},
+            projection={"data.tasks": True}
         )
-        _asset_types = sorted(_asset_types, key=lambda d: d['name'])
-
-        all_asset_docs = {d["_id"]: d for d in _assets + _episodes + _sequences + _asset_types}
-
-        def count_depth(doc_):
-            def depth(_d):
-                p = _d["data"].get("visualParent")
-                p_doc = all_asset_docs.get(p)
-                yield 0 if p is None or p_doc is None else 1 + sum(depth(p_doc))
-
-            return sum(depth(doc_))
-
-        def group_key(doc_):
-            """Key for sort/group assets by visual hierarchy depth
-            :param dict doc_: Asset document
-            :rtype: tuple[int, ObjectId] or tuple[int, str] or tuple[int, None]
-            """
-            _depth = count_depth(doc_)
-            _vp = doc_["data"]["visualParent"] if _depth else doc_.get("silo")
-            return _depth, _vp
-
-        return [
-            (depth, key, list(group))
-            for (depth, key), group in
-            groupby(
-                sorted(all_asset_docs.values(), key=group_key),
-                key=group_key
-            )
-        ]
 
     def get_silo_hidden(self, coll_name, silo_name):
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
+        coll = self._coll(coll_name)
 
         silo = coll.find_one({'type': 'silo', 'name': silo_name})
         if silo:
@@ -1016,9 +1004,8 @@ class AvalonMongo(object):
         :return: Update result
         :rtype: UpdateResult
         """
-        _user = getpass.getuser()
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
+        _user = current_user()
+        coll = self._coll(coll_name)
 
         result = coll.update_one(
             {"type": "project"},
@@ -1033,9 +1020,8 @@ class AvalonMongo(object):
         :return: Update result
         :rtype: UpdateResult
         """
-        _user = getpass.getuser()
-        db = self.conn[self._db_name]  # type: MongoDatabase
-        coll = db.get_collection(coll_name)  # type: MongoCollection
+        _user = current_user()
+        coll = self._coll(coll_name)
 
         result = coll.update_one(
             {"type": "project"},
@@ -1051,17 +1037,24 @@ def ping(database, retry=3):
     :param AvalonMongo database: An AvalonMongo connection instance
     :param int retry: Max retry times, default 3
     :return: None
-    :raises IOError: If not able to connect in given retry times
+    :raises IOError: If not able to connect in given retry times, or
+        failed with non-network error (e.g. auth, config)
     """
     for i in range(retry):
         try:
-            t1 = time.time()
-            database.conn.server_info()
+            t1 = time.monotonic()
+            database.conn.admin.command("ping")
 
-        except Exception:
+        except ConnectionFailure:
+            # only network errors are retried
             log.error(f"Retrying..[{i}]")
-            time.sleep(1)
-            database.timeout *= 1.5
+            time.sleep(min(0.1 * 2 ** i, 2.0) + random.random() * 0.1)
+
+        except PyMongoError as e:
+            # fail fast on others (auth, config)
+            raise IOError(
+                "ERROR: Failed to connect to %s: %s" % (database.uri, e)
+            ) from e
 
         else:
             break
@@ -1073,5 +1066,5 @@ def ping(database, retry=3):
         )
 
     log.info(
-        "Connected to %s, delay %.3f s" % (database.uri, time.time() - t1)
+        "Connected to %s, delay %.3f s" % (database.uri, time.monotonic() - t1)
     )
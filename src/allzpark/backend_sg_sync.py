@@ -1,16 +1,19 @@
 
 import os
+import json
 import time
+import sqlite3
 import logging
-import getpass
-from shotgun_api3 import Shotgun
+import functools
+import threading
+from shotgun_api3 import Shotgun, AuthenticationFault
+from itertools import chain
 from dataclasses import dataclass
-from functools import singledispatch
 from collections import MutableMapping
-from typing import Union, Iterator, Callable, Set, overload
+from typing import Union, Iterator, Callable, FrozenSet
 from rez.config import config as rezconfig
 from .core import SuiteTool, AbstractScope
-from .util import elide
+from .util import elide, current_user, get_executor, SharedConnections
 from .exceptions import BackendError
 
 # typing
@@ -49,91 +52,157 @@ def get_entrance(sg_server=None, api_key=None, script_name=None):
 
 MANAGER_ROLE = "admin"
 
+_PROJECT_FIELDS = (
+    "id",
+    "code",
+    "name",
+    "tank_name",
+    "sg_project_root",
+    "sg_cg_lead",
+    "sg_pc",
+)
+_PROJECT_FILTERS = (
+    ("archived", "is", False),
+    ("is_template", "is", False),
+    ("tank_name", "is_not", None),
+    ("sg_project_root", "is_not", None),
+)
+_HUMAN_USER_FIELDS = ("login",)
+
+_ENTRANCE_CATS = frozenset({"entrance"})
+_PROJECT_CATS = frozenset({"project", "entrance"})
+
+
+class _DiskCache(object):
+    """A minimal SQLite backed cache of one value per namespace with expiry
+
+    Cached values must be JSON serializable. Storage errors are logged and
+    treated as cache miss, so a broken cache file never breaks a query.
+
+    The database is opened once per process, expired entries are dropped
+    at that time instead of on every write.
+    """
 
-@dataclass(frozen=True)
-class _Scope(AbstractScope):
-
-    def exists(self) -> bool:
-        return True
+    def __init__(self, path, ttl):
+        self._path = path
+        self._ttl = ttl
+        self._conn = None
+        self._opened = False
+        self._lock = threading.Lock()
 
-    def iter_children(self: "Entrance") -> Iterator["Project"]:
-        """Iter child scopes
+    def _open(self):
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=5, check_same_thread=False)
+        try:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS listing "
+                             "(namespace TEXT PRIMARY KEY, expire REAL, "
+                             "value TEXT)")
+                conn.execute("DELETE FROM listing WHERE expire < ?",
+                             (time.time(),))
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def _connection(self):
+        # note: caller must hold the lock. Only try opening once, so a broken
+        #   cache file doesn't cost anything after the first failure.
+        if not self._opened:
+            self._opened = True
+            try:
+                self._conn = self._open()
+            except (sqlite3.Error, OSError) as e:
+                log.debug(f"ShotGrid disk cache open failed: {str(e)}")
+        return self._conn
+
+    def _get(self, namespace):
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute("SELECT expire, value FROM listing "
+                               "WHERE namespace=?", (namespace,)).fetchone()
+        if row is None or row[0] < time.time():
+            return None
+        return json.loads(row[1])
+
+    def _set(self, namespace, value):
+        raw = json.dumps(value)
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO listing VALUES (?, ?, ?)",
+                             (namespace, time.time() + self._ttl, raw))
+
+    def fetch(self, namespace, loader):
+        """Returns cached value of namespace, or call loader and cache it
+
+        :param str namespace: Cache namespace
+        :param loader: A callable that returns the value on cache miss
+        :type loader: Callable[[], object]
+        :return: Cached or loaded value
         """
-        return iter_shotgrid_scopes(self)
-
-    @overload
-    def suite_path(self: "Entrance") -> str:
-        ...
+        try:
+            value = self._get(namespace)
+        except (sqlite3.Error, ValueError) as e:
+            log.debug(f"ShotGrid disk cache read failed: {str(e)}")
+            value = None
 
-    @overload
-    def suite_path(self: "Project") -> None:
-        ...
+        if value is not None:
+            return value
 
-    def suite_path(self):
-        """Iter child scopes
+        value = loader()
+        try:
+            self._set(namespace, value)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            log.debug(f"ShotGrid disk cache write failed: {str(e)}")
+        return value
 
-        :type self: Entrance or Project
-        :return:
-        :rtype: Union[str, None]
-        """
-        return scope_suite_path(self)
+    def invalidate(self, namespace):
+        """Drop cached value of namespace"""
+        try:
+            with self._lock:
+                conn = self._connection()
+                if conn is not None:
+                    with conn:
+                        conn.execute("DELETE FROM listing WHERE namespace=?",
+                                     (namespace,))
+        except sqlite3.Error as e:
+            log.debug(f"ShotGrid disk cache invalidation failed: {str(e)}")
 
-    def make_tool_filter(
-            self: Union["Entrance", "Project"]
-    ) -> ToolFilterCallable:
-        """
-        :return:
-        """
-        return tool_filter_factory(self)
 
-    def obtain_workspace(
-            self: Union["Entrance", "Project"],
-            tool: SuiteTool = None,
-    ) -> Union[str, None]:
-        """
+_disk_cache = _DiskCache(
+    path=os.path.expanduser("~/.allzpark/sg_cache.db"),
+    ttl=300,  # seconds
+)
 
-        :param tool:
-        :type tool: SuiteTool
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: str or None
-        """
-        return obtain_workspace(self, tool)
 
-    def additional_env(
-            self: Union["Entrance", "Project"], tool: SuiteTool
-    ) -> dict:
-        """
+@dataclass(frozen=True)
+class _Scope(AbstractScope):
+    __slots__ = ()
 
-        :param tool:
-        :type tool: SuiteTool
-        :type self: Entrance or Project or Asset or Task
-        :return:
-        :rtype: dict
-        """
-        if isinstance(self, Project):
-            return {
-                # for sg_sync
-                "AVALON_PROJECTS": self.sg_project_root,
-                "AVALON_PROJECT": self.tank_name,
-                "SG_PROJECT_ID": self.id,
-            }
-        return dict()
+    def exists(self) -> bool:
+        return True
 
-    def current_user_roles(
-            self: Union["Entrance", "Project", "Asset", "Task"]
-    ) -> list:
+    def current_user_roles(self) -> list:
         """
-        :type self: Entrance or Project or Asset or Task
         :return:
         :rtype: list
         """
         return []
 
+
+# note:
+#   `__slots__` are declared by hand since `dataclass(slots=True)` requires
+#   Python 3.10.
 @dataclass(frozen=True)
 class Entrance(_Scope):
     name = "sg_sync"
     upstream = None
+    __slots__ = ("sg_server", "api_key", "script_name")
     sg_server: str
     api_key: str
     script_name: str
@@ -142,150 +211,189 @@ class Entrance(_Scope):
         return f"Entrance(name={self.name}, sg_server={self.sg_server})"
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash((self.name, self.sg_server))
+
+    def iter_children(self) -> Iterator["Project"]:
+        return iter_shotgrid_projects(get_connection(self))
+
+    def cache_clear(self):
+        """Drop cached ShotGrid query results and suite dir probes"""
+        _disk_cache.invalidate(self.sg_server)
+        _shotgrid_suite_root.cache_clear()
+        _dir_exists.cache_clear()
+
+    def suite_path(self) -> Union[str, None]:
+        return os.getenv("SHOTGRID_ENTRANCE_SUITE")
+
+    def make_tool_filter(self) -> ToolFilterCallable:
+        user = current_user()
+
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and tool.ctx_category in _ENTRANCE_CATS
+                and (not required_roles
+                     or user in required_roles)
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> None:
+        _tool = f" for {tool.name!r}" if tool else ""
+        log.debug(f"No workspace{_tool} in scope {elide(self)}.")
+        return None
+
+    def additional_env(self, tool: SuiteTool) -> dict:
+        _ = tool  # consume unused arg
+        return {}
 
 
 @dataclass(frozen=True)
 class Project(_Scope):
+    __slots__ = (
+        "name",
+        "upstream",
+        "roles",
+        "code",
+        "id",
+        "tank_name",
+        "sg_project_root",
+        "_env",
+    )
     name: str
     upstream: Entrance
-    roles: Set[str]
+    roles: FrozenSet[str]
     code: str
     id: str
     tank_name: str
     sg_project_root: str
 
+    def __post_init__(self):
+        # environ never changes, build once (frozen, hence object.__setattr__)
+        object.__setattr__(self, "_env", {
+            # for sg_sync
+            "AVALON_PROJECTS": self.sg_project_root,
+            "AVALON_PROJECT": self.tank_name,
+            "SG_PROJECT_ID": self.id,
+        })
+
     def __repr__(self):
         return f"Project(" \
                f"name={self.name}, tank_name={self.tank_name}, " \
                f"upstream={self.upstream})"
 
     def __hash__(self):
-        return hash(repr(self))
-
-
-@singledispatch
-def iter_shotgrid_scopes(scope):
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@iter_shotgrid_scopes.register
-def _(scope: Entrance) -> Iterator[Project]:
-    server = ShotGridConn(scope.sg_server,
-                          scope.script_name,
-                          scope.api_key,
-                          entrance=scope)
-    return iter_shotgrid_projects(server)
-
-
-@iter_shotgrid_scopes.register
-def _(scope: Project) -> tuple:
-    log.debug(f"Endpoint reached: {elide(scope)}")
-    return ()
-
-
-@singledispatch
-def scope_suite_path(scope):
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
-
-
-@scope_suite_path.register
-def _(scope: Entrance) -> str:
-    _ = scope
-    return os.getenv("SHOTGRID_ENTRANCE_SUITE")
-
-
-@scope_suite_path.register
-def _(scope: Project) -> Union[str, None]:
+        # note: cheaper than dataclass generated hash over all fields
+        return hash((self.name, self.id))
+
+    def iter_children(self) -> tuple:
+        log.debug(f"Endpoint reached: {elide(self)}")
+        return ()
+
+    def suite_path(self) -> Union[str, None]:
+        shotgrid_suite_root = _shotgrid_suite_root()
+        if not shotgrid_suite_root:
+            log.debug("No suite root for ShotGrid.")
+            return
+
+        suite_path = os.path.join(shotgrid_suite_root, self.name)
+        if not _dir_exists(suite_path):
+            log.debug(f"No suite root for ShotGrid project {self.name}")
+            return
+
+        return suite_path
+
+    def make_tool_filter(self) -> ToolFilterCallable:
+        roles = self.roles
+
+        def _filter(tool: SuiteTool) -> bool:
+            required_roles = tool.metadata.required_roles
+            return (
+                not tool.metadata.hidden
+                and tool.ctx_category in _PROJECT_CATS
+                and (not required_roles
+                     or not roles.isdisjoint(required_roles))
+            )
+        return _filter
+
+    def obtain_workspace(self, tool: SuiteTool = None) -> str:
+        _ = tool
+        root = self.sg_project_root
+        root += "/" if ":" in root else ""
+        # note: instead of checking root.endswith ':', just seeing if ':' in
+        #   string let us also check if there is redundant path sep written
+        #   in ShotGrid. We are on Windows.
+        return os.path.join(root, self.tank_name)
+
+    def additional_env(self, tool: SuiteTool) -> dict:
+        _ = tool  # consume unused arg
+        return dict(self._env)  # a copy, callers may update it
+
+
+@functools.lru_cache(maxsize=1)
+def _shotgrid_suite_root():
     roots = parkconfig.suite_roots  # type: dict
     if not isinstance(roots, MutableMapping):
         raise BackendError("Invalid configuration, 'suite_roots' should be "
                            f"dict-like type value, not {type(roots)}.")
+    return roots.get("shotgrid")
 
-    shotgrid_suite_root = roots.get("shotgrid")
-    if not shotgrid_suite_root:
-        log.debug("No suite root for ShotGrid.")
-        return
-
-    suite_path = os.path.join(shotgrid_suite_root, scope.name)
-    if not os.path.isdir(suite_path):
-        log.debug(f"No suite root for ShotGrid project {scope.name}")
-        return
-
-    return suite_path
 
+@functools.lru_cache(maxsize=256)
+def _dir_exists(path):
+    return os.path.isdir(path)
 
-@singledispatch
-def tool_filter_factory(scope) -> ToolFilterCallable:
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
 
+_conns = SharedConnections(
+    connect=lambda entrance: ShotGridConn(entrance.sg_server,
+                                          entrance.script_name,
+                                          entrance.api_key,
+                                          entrance=entrance),
+    close=lambda server: server.close(),
+)
 
-@tool_filter_factory.register
-def _(scope: Entrance) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        ctx_category = tool.ctx_name.split(".", 1)[0]
-        categories = {"entrance"}
-        return (
-            not tool.metadata.hidden
-            and ctx_category in categories
-            and (not required_roles
-                 or getpass.getuser() in required_roles)
-        )
-    _ = scope  # consume unused arg
-    return _filter
-
-
-@tool_filter_factory.register
-def _(scope: Project) -> ToolFilterCallable:
-    def _filter(tool: SuiteTool) -> bool:
-        required_roles = tool.metadata.required_roles
-        ctx_category = tool.ctx_name.split(".", 1)[0]
-        categories = {"project", "entrance"}
-        return (
-            not tool.metadata.hidden
-            and ctx_category in categories
-            and (not required_roles
-                 or scope.roles.intersection(required_roles))
-        )
-    return _filter
 
+def get_connection(entrance):
+    """Returns a ShotGrid connection that is shared by the entrance scope
 
-@singledispatch
-def obtain_workspace(scope, tool=None):
-    _ = tool  # consume unused arg
-    raise NotImplementedError(f"Unknown scope type: {type(scope)}")
+    :param Entrance entrance: The entrance scope to connect from
+    :rtype: ShotGridConn
+    """
+    return _conns.get(entrance)
 
 
-@obtain_workspace.register
-def _(scope: Entrance, tool: SuiteTool = None) -> None:
-    _tool = f" for {tool.name!r}" if tool else ""
-    log.debug(f"No workspace{_tool} in scope {elide(scope)}.")
-    return None
+def close_all():
+    """Close all shared ShotGrid connections"""
+    _conns.close_all()
 
 
-@obtain_workspace.register
-def _(scope: Project, tool: SuiteTool = None) -> Union[str, None]:
-    _ = tool
-    root = scope.sg_project_root
-    root += "/" if ":" in root else ""
-    # note: instead of checking root.endswith ':', just seeing if ':' in
-    #   string let us also check if there is redundant path sep written
-    #   in ShotGrid. We are on Windows.
-    return os.path.join(root, scope.tank_name)
+def _project_manager_ids(project_doc):
+    d = project_doc
+    # note: don't reuse `d` as the inner variable name, that would shadow the
+    #   project document and collect wrong ids.
+    return {
+        u["id"] for u in chain(d.get("sg_cg_lead") or (), d.get("sg_pc") or ())
+    }
 
 
 def iter_shotgrid_projects(server: "ShotGridConn"):
+    username = current_user()
+    # look up current user aside while projects are being paged in
+    user_docs = server.submit("HumanUser",
+                              [("login", "is", username)],
+                              _HUMAN_USER_FIELDS)
+    user_ids = None
+
     for d in server.iter_valid_projects():
-        roles = set()
-        username = getpass.getuser()
-        sg_user_ids = set([
-            _["id"] for _ in (d.get("sg_cg_lead", []) + d.get("sg_pc", []))
-        ])
-        if username in server.find_human_logins(list(sg_user_ids)):
-            roles.add(MANAGER_ROLE)
+        if user_ids is None:
+            user_ids = {
+                u["id"] for u in user_docs.result() if u["login"] == username
+            }
         # allow assigning personnel directly in package
-        roles.add(username)
+        if not user_ids.isdisjoint(_project_manager_ids(d)):
+            roles = frozenset((MANAGER_ROLE, username))
+        else:
+            roles = frozenset((username,))
 
         yield Project(
             name=d["name"],
@@ -310,47 +418,94 @@ class ShotGridConn(object):
             connection. Optional.
         :type entrance: Entrance or None
         """
-        conn = Shotgun(sg_server,
-                       script_name=script_name,
-                       api_key=api_key,
-                       connect=False)
-        conn.config.timeout_secs = 1
-
-        self.conn = conn
         self.sg_server = sg_server
         self.api_key = api_key
         self.script_name = script_name
         self.entrance = entrance
+        self.conn = self._connect()
+        self._local = threading.local()
+        self._thread_conns = []
+
+    def _connect(self):
+        conn = Shotgun(self.sg_server,
+                       script_name=self.script_name,
+                       api_key=self.api_key,
+                       connect=False)
+        conn.config.timeout_secs = 1
+        return conn
+
+    def find(self, entity_type, filters, fields, conn=None):
+        """
+        :param str entity_type: ShotGrid entity type
+        :param list filters: Query filters
+        :param list fields: Fields to return
+        :param conn: Shotgun instance to query with, default `self.conn`
+        :type conn: Shotgun or None
+        :return: Matched entity documents
+        :rtype: list[dict]
+        """
+        conn = conn or self.conn
+        return conn.find(entity_type, filters, fields)
+
+    def _find_in_thread(self, entity_type, filters, fields):
+        # Shotgun instance is not thread-safe, one per worker thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            self._thread_conns.append(conn)
+        return self.find(entity_type, filters, fields, conn=conn)
+
+    def close(self):
+        """Close underlying HTTP connections"""
+        for conn in [self.conn] + self._thread_conns:
+            conn.close()
+        self._thread_conns = []
+
+    def submit(self, entity_type, filters, fields):
+        """Run find query in background thread
+
+        :param str entity_type: ShotGrid entity type
+        :param list filters: Query filters
+        :param list fields: Fields to return
+        :return: A future of matched entity documents
+        :rtype: concurrent.futures.Future
+        """
+        return get_executor().submit(
+            self._find_in_thread, entity_type, filters, fields
+        )
+
+    @staticmethod
+    def valid_projects_query():
+        return "Project", _PROJECT_FILTERS, _PROJECT_FIELDS
+
+    @staticmethod
+    def is_valid_project(doc):
+        # note: ShotGrid filter has no negated 'starts_with' operator, so
+        #   test projects are dropped here. Only lower the prefix we compare.
+        return doc["name"][:4].lower() != "test"
 
     def iter_valid_projects(self):
-        fields = [
-            "id",
-            "code",
-            "name",
-            "tank_name",
-            "sg_project_root",
-            "sg_cg_lead",
-            "sg_pc",
-        ]
-        filters = [
-            ["archived", "is", False],
-            ["is_template", "is", False],
-            ["tank_name", "is_not", None],
-            ["sg_project_root", "is_not", None],
-        ]
-        for doc in self.conn.find("Project", filters, fields):
-            lower_name = doc["name"].lower()
-            if lower_name.startswith("test"):
-                continue
-            yield doc
-
-    def find_human_logins(self, user_ids):
-        if not user_ids:
-            return []
-        fields = ["login"]
-        filters = [["id", "in", user_ids]]
-        docs = self.conn.find("HumanUser", filters=filters, fields=fields)
-        return [d["login"] for d in docs]
+        """Iter valid project docs
+
+        The whole listing is cached on disk for a short while, as one entry.
+        """
+        entity_type, filters, fields = self.valid_projects_query()
+
+        def _load():
+            return [
+                doc for doc in self.find(entity_type, filters, fields)
+                if self.is_valid_project(doc)
+            ]
+
+        yield from _disk_cache.fetch(self.sg_server, _load)
+
+
+def _is_auth_error(exc):
+    return (
+        isinstance(exc, AuthenticationFault)
+        # e.g. shotgun_api3.ProtocolError
+        or getattr(exc, "errcode", None) in (401, 403)
+    )
 
 
 def ping(server, retry=3):
@@ -361,24 +516,28 @@ def ping(server, retry=3):
     :return: None
     :raises IOError: If not able to connect in given retry times
     """
-    e = None
+    last_exc = None
     for i in range(retry):
         try:
-            t1 = time.time()
+            t1 = time.monotonic()
             server.conn.info()
 
-        except Exception as e:
+        except Exception as exc:
+            last_exc = exc
+            if _is_auth_error(exc):
+                break  # retrying won't help
             log.error(f"Retrying..[{i}]")
-            time.sleep(1)
+            time.sleep(0.1 * 2 ** i)  # backoff
 
         else:
+            last_exc = None
             break
 
-    else:
+    if last_exc is not None:
         raise IOError(f"ERROR: Couldn't connect to {server.sg_server!r} "
-                      f"due to: {str(e)}")
+                      f"due to: {str(last_exc)}") from last_exc
 
     log.info(
         f"ShotGrid server {server.sg_server!r} connected, "
-        f"delay {time.time() - t1:.3f}"
+        f"delay {time.monotonic() - t1:.3f}"
     )
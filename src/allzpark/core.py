@@ -1,44 +1,42 @@
 
+import os
 import logging
 import functools
-import traceback
-from typing import Set, Union, Iterator, Callable
+import threading
+from collections import ChainMap, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple, FrozenSet, Union, Iterator, Callable
 from dataclasses import dataclass
 from rez.packages import Variant
 from rez.config import config as rezconfig
 from rez.package_repository import package_repository_manager
 from sweet.core import RollingContext, SweetSuite
 from .exceptions import BackendError
+from .util import get_executor
 
 log = logging.getLogger("allzpark")
 
 
-def _load_backends():
+def _try_avalon_backend():
+    from . import backend_avalon as avalon
 
-    def try_avalon_backend():
-        from . import backend_avalon as avalon
+    scope = avalon.get_entrance()
+    avalon.ping(scope.db)
+    return scope  # type: avalon.Entrance
 
-        scope = avalon.get_entrance()
-        avalon.ping(
-            avalon.AvalonMongo(scope.uri, scope.timeout, entrance=scope)
-        )
-        return scope  # type: avalon.Entrance
 
-    def try_sg_sync_backend():
-        from . import backend_sg_sync as shotgrid
+def _try_sg_sync_backend():
+    from . import backend_sg_sync as shotgrid
 
-        scope = shotgrid.get_entrance()
-        shotgrid.ping(
-            shotgrid.ShotGridConn(scope.sg_server,
-                                  scope.script_name,
-                                  scope.api_key,
-                                  entrance=scope)
-        )
-        return scope  # type: shotgrid.Entrance
+    scope = shotgrid.get_entrance()
+    shotgrid.ping(shotgrid.get_connection(scope))
+    return scope  # type: shotgrid.Entrance
 
+
+def _load_backends():
     return [
-        ("avalon", try_avalon_backend),
-        ("sg_sync", try_sg_sync_backend),
+        ("avalon", _try_avalon_backend),
+        ("sg_sync", _try_sg_sync_backend),
         # could be ftrack, or shotgrid, could be...
     ]
 
@@ -53,11 +51,26 @@ def init_backends(no_warning=False):
     possible_backends = _load_backends()
     available_backends = []
 
-    for name, entrance_getter in possible_backends:
+    def _init(name, entrance_getter):
         log.info(f"> Init backend {name!r}..")
         try:
-            entrance = entrance_getter()
+            return entrance_getter(), None
         except Exception as e:
+            return None, e
+
+    # backends are probed over network, probe them concurrently so the
+    # startup waits for the slowest one instead of all of them in series.
+    with ThreadPoolExecutor(
+            max_workers=max(1, len(possible_backends)),
+            thread_name_prefix="backend-init") as executor:
+        futures = [
+            executor.submit(_init, name, getter)
+            for name, getter in possible_backends
+        ]
+
+    for (name, _), future in zip(possible_backends, futures):
+        entrance, e = future.result()
+        if e is not None:
             if no_warning:
                 continue
             log.warning(
@@ -90,6 +103,7 @@ def load_suite(path):
 
 
 class AbstractScope:
+    __slots__ = ()
     name: str
     upstream: Union["AbstractScope", None]
 
@@ -117,7 +131,7 @@ class AbstractScope:
         ...             required_roles = tool.metadata.required_roles
         ...             return (
         ...                 not tool.metadata.hidden
-        ...                 and self.roles.intersection(required_roles)  # noqa
+        ...                 and self.roles & required_roles  # noqa
         ...             )
         ...         return _filter
 
@@ -178,23 +192,39 @@ def get_tool_from_breadcrumb(
         return
     log.debug(f"Searching tool {tool_alias!r} in scope {scope}")
 
-    tool = None
-    for tool in _tools_iter(scope, caching=True):
-        if tool.alias == tool_alias:
-            break
-    else:
+    tool = _alias_index(scope, None).get(tool_alias)
+    if tool is None:
         log.debug("No matched tool found in scope.")
 
     return tool
 
 
+# interned role sets, tools usually share only a handful of role lists
+_ROLES_CACHE: Dict[Tuple[str, ...], FrozenSet[str]] = {}
+
+
+def _intern_roles(roles) -> FrozenSet[str]:
+    key = tuple(sorted(set(roles)))
+    try:
+        return _ROLES_CACHE[key]
+    except KeyError:
+        return _ROLES_CACHE.setdefault(key, frozenset(key))
+
+
+# note:
+#   `__slots__` are declared by hand since `dataclass(slots=True)` requires
+#   Python 3.10+. Keep them in sync with the fields.
 @dataclass(frozen=True)
 class ToolMetadata:
+    __slots__ = (
+        "label", "icon", "color", "hidden", "required_roles", "no_console",
+        "start_new_session", "remember_me", "__weakref__",
+    )
     label: str
     icon: str
     color: str
     hidden: bool
-    required_roles: Set[str]
+    required_roles: FrozenSet[str]
     no_console: bool
     start_new_session: bool
     remember_me: bool
@@ -202,27 +232,52 @@ class ToolMetadata:
 
 @dataclass(frozen=True)
 class SuiteTool:
+    # `metadata` and `ctx_category` are not fields, they are derived from
+    # `variant` and `ctx_name` once in __post_init__.
+    __slots__ = (
+        "name", "alias", "ctx_name", "variant", "scope",
+        "metadata", "ctx_category", "__weakref__",
+    )
     name: str
     alias: str
     ctx_name: str
     variant: Variant
     scope: Union[AbstractScope, None]
 
+    def __post_init__(self):
+        # context name prefix, e.g. "project" of "project.maya"
+        category = self.ctx_name.partition(".")[0]
+        object.__setattr__(self, "ctx_category", category)
+        object.__setattr__(self, "metadata", self._load_metadata())
+
+    def bind(self, scope) -> "SuiteTool":
+        """Return a copy of this tool bound to `scope`
+
+        Unlike `dataclasses.replace()`, derived attributes are copied instead
+        of being computed again.
+        """
+        tool = object.__new__(SuiteTool)
+        for name in SuiteTool.__slots__:
+            if name != "__weakref__":
+                object.__setattr__(tool, name, getattr(self, name))
+        object.__setattr__(tool, "scope", scope)
+        return tool
+
     @property
     def context(self) -> RollingContext:
         return self.variant.context
 
-    @property
-    def metadata(self) -> ToolMetadata:
-        data = getattr(self.variant, "_data", {}).copy()
-        tool = data.get("override", {}).get(self.name)  # e.g. pre tool icon
-        data.update(tool or {})
+    def _load_metadata(self) -> ToolMetadata:
+        variant_data = getattr(self.variant, "_data", None) or {}
+        # e.g. pre tool icon
+        tool = (variant_data.get("override") or {}).get(self.name)
+        data = ChainMap(tool or {}, variant_data)  # layered, no copy
         return ToolMetadata(
             label=data.get("label", self.variant.name),
             icon=data.get("icon"),
             color=data.get("color"),
             hidden=data.get("hidden", False),
-            required_roles=set(data.get("required_roles", [])),
+            required_roles=_intern_roles(data.get("required_roles", [])),
             no_console=data.get("no_console", True),
             start_new_session=data.get("start_new_session", True),
             remember_me=data.get("remember_me", True),
@@ -240,8 +295,12 @@ def cache_clear():
 
     # clear cached suites and tools
     log.debug("Cleaning cached suites and tools")
-    _load_suite.cache_clear()
+    _load_suite_cached.cache_clear()
+    _rxt_cache_clear()
     list_tools.cache_clear()
+    _resolved_tools.cache_clear()
+    _upstream_chain.cache_clear()
+    _alias_index.cache_clear()
 
     log.debug("Core cache cleared.")
 
@@ -249,38 +308,78 @@ def cache_clear():
 def _tools_iter(scope, filtering=None, caching=False):
     _get_suite = _load_suite if caching else load_suite
 
-    def _iter_tools(_scope):
+    def _try_get_suite(suite_path):
         try:
-            suite_path = _scope.suite_path()
-        except BackendError as e:
-            log.error(str(e))
+            return _get_suite(suite_path)
+        except Exception as e:
+            # traceback formatting reads source files, only when debugging
+            log.error("Failed to load suite %s: %s", suite_path, e,
+                      exc_info=log.isEnabledFor(logging.DEBUG))
+
+    def _iter_tools(_scope):
+        suite_paths = []
+        for _scope in _upstream_chain(_scope):
+            try:
+                suite_path = _scope.suite_path()
+            except BackendError as e:
+                log.error(str(e))
+            else:
+                if suite_path:
+                    suite_paths.append(suite_path)
+
+        # suites in upstream chain are independent, load them concurrently
+        # so the latency is the slowest one instead of the sum of them.
+        if len(suite_paths) > 1:
+            suites = get_executor().map(_try_get_suite, suite_paths)
         else:
-            if suite_path:
-                try:
-                    suite = _get_suite(suite_path)
-                except Exception as e:
-                    log.error(traceback.format_exc())
-                    log.error(f"Failed load suite: {str(e)}")
-                else:
-                    for _tool in suite.iter_tools(scope=scope):
-                        yield _tool
-        if _scope.upstream is not None:
-            for _tool in _iter_tools(_scope.upstream):
-                yield _tool
+            suites = map(_try_get_suite, suite_paths)
+
+        for suite in suites:
+            if suite is not None:
+                yield from suite.iter_tools(scope=scope)
 
+    func = _tool_filter(scope, filtering)
+    if func is None:
+        yield from _iter_tools(scope)
+    else:
+        for tool in _iter_tools(scope):
+            if func(tool):
+                yield tool
+
+
+@functools.lru_cache(maxsize=None)
+def _upstream_chain(scope):
+    """Returns the scope and all its upstream scopes, nearest first
+
+    :rtype: tuple[AbstractScope]
+    """
+    chain = []
+    while scope is not None:
+        chain.append(scope)
+        scope = scope.upstream
+    return tuple(chain)
+
+
+def _tool_filter(scope, filtering=None):
     if filtering is False:
-        func = None
+        return None
     elif callable(filtering):
-        func = filtering
+        return filtering
     else:
-        func = scope.make_tool_filter()
+        return scope.make_tool_filter()
 
-    for tool in filter(func, _iter_tools(scope)):
-        yield tool
 
-
-@functools.lru_cache(maxsize=None)
 def _load_suite(path):
+    """Load suite with cache, keyed by real path
+
+    Changes on disk are picked up after `cache_clear()`, which also clears
+    the tool caches built on top of this.
+    """
+    return _load_suite_cached(os.path.realpath(path))
+
+
+@functools.lru_cache(maxsize=256)
+def _load_suite_cached(path):
     return load_suite(path)
 
 
@@ -294,9 +393,37 @@ def list_tools(scope, filtering=None):
         filtering tools with it instead.
     :type scope: AbstractScope
     :type filtering: bool or Callable or None
-    :rtype: Iterator[SuiteTool]
+    :rtype: tuple[SuiteTool]
+    """
+    func = _tool_filter(scope, filtering)
+    tools = _resolved_tools(scope)
+    return tools if func is None else tuple(filter(func, tools))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolved_tools(scope):
+    """Returns all tools within scope and upstream scopes, not filtered
+
+    This is the layer that walks scopes and loads suites, so `list_tools()`
+    with different filtering on the same scope only filters the result.
+
+    :rtype: tuple[SuiteTool]
     """
-    return list(_tools_iter(scope, filtering, caching=True))
+    return tuple(_tools_iter(scope, filtering=False, caching=True))
+
+
+@functools.lru_cache(maxsize=None)
+def _alias_index(scope, filtering=None):
+    """Returns tools within scope and upstream scopes mapped by alias
+
+    Built on top of `list_tools()`, the first tool wins if aliases collide.
+
+    :rtype: dict[str, SuiteTool]
+    """
+    index = dict()
+    for tool in list_tools(scope, filtering):
+        index.setdefault(tool.alias, tool)
+    return index
 
 
 def iter_tools(scope, filtering=None):
@@ -313,8 +440,24 @@ def iter_tools(scope, filtering=None):
     return _tools_iter(scope, filtering, caching=False)
 
 
+# loaded .rxt contexts keyed by (path, mtime), shared across suite instances
+# and least recently used ones are evicted. Contexts in here are read-only,
+# re-resolving replaces the suite's context instead of changing it in place.
+_rxt_cache = OrderedDict()
+_rxt_cache_max = 512
+_rxt_cache_lock = threading.Lock()
+
+
+def _rxt_cache_clear():
+    with _rxt_cache_lock:
+        _rxt_cache.clear()
+
+
 class ReadOnlySuite(SweetSuite):
     """A Read-Only SweetSuite"""
+    _unbound_tools = None
+    _scoped_tools = None
+    _scoped_tools_max = 256
 
     def _invalid_operation(self, *_, **__):
         raise RuntimeError("Invalid operation, this suite is Read-Only.")
@@ -337,28 +480,88 @@ class ReadOnlySuite(SweetSuite):
         set_description = \
         save = _invalid_operation
 
+    def context(self, name):
+        """Get a context, loaded .rxt is shared with other suite instances
+
+        The returned context may be shared, it must not be modified.
+        """
+        data = self._context(name)
+        if data.get("context") or not self.load_path:
+            return super(ReadOnlySuite, self).context(name)
+
+        path = self._context_path(name)
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            return super(ReadOnlySuite, self).context(name)
+
+        with _rxt_cache_lock:
+            context = _rxt_cache.get(key)
+            if context is not None:
+                _rxt_cache.move_to_end(key)
+        if context is None:
+            context = super(ReadOnlySuite, self).context(name)
+            with _rxt_cache_lock:
+                _rxt_cache[key] = context
+                while len(_rxt_cache) > _rxt_cache_max:
+                    _rxt_cache.popitem(last=False)
+        else:
+            data["context"] = context
+            data["loaded"] = True
+
+        return context
+
     def re_resolve_rxt_contexts(self):
         """Re-resolve all contexts that loaded from .rxt files
         :return:
         """
+        # resolved one by one, rez resolving is not known to be thread-safe
         for name in list(self.contexts.keys()):
             context = self.context(name)
             if context.load_path:
                 self._update_context(name, re_resolve_rxt(context))
 
+    def unbound_tools(self):
+        """Tools in this suite that are not bound to any scope
+
+        Computed once, since this suite is read-only.
+
+        :rtype: tuple[SuiteTool]
+        """
+        if self._unbound_tools is None:
+            self._unbound_tools = tuple(
+                SuiteTool(
+                    name=entry["tool_name"],
+                    alias=entry["tool_alias"],
+                    ctx_name=entry["context_name"],
+                    variant=entry["variant"],
+                    scope=None,
+                )
+                for entry in self.get_tools().values()
+            )
+        return self._unbound_tools
+
     def iter_tools(self, scope=None):
         """Iter tools in this suite
+
+        Tools that bound to the scope are cached, since this suite is
+        read-only.
+
         :return:
         :rtype: collections.Iterator[SuiteTool]
         """
-        for alias, entry in self.get_tools().items():
-            yield SuiteTool(
-                name=entry["tool_name"],
-                alias=entry["tool_alias"],
-                ctx_name=entry["context_name"],
-                variant=entry["variant"],
-                scope=scope,
+        if self._scoped_tools is None:
+            self._scoped_tools = dict()
+        try:
+            tools = self._scoped_tools[scope]
+        except KeyError:
+            if len(self._scoped_tools) >= self._scoped_tools_max:
+                self._scoped_tools.clear()
+            tools = self._scoped_tools[scope] = tuple(
+                tool if scope is None else tool.bind(scope)
+                for tool in self.unbound_tools()
             )
+        return iter(tools)
 
     def get_tools(self):
         self._update_tools(suppress_err=True)
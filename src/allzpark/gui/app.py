@@ -21,6 +21,10 @@ if sys.platform == "darwin":
 
 log = logging.getLogger("allzpark")
 
+# QSettings ini serialised booleans
+_TRUE_STR = frozenset({"2", "1", "true"})
+_FALSE_STR = frozenset({"0", "false"})
+
 
 def launch(app_name="park-gui"):
     """GUI entry point
@@ -132,6 +136,8 @@ class Session(object):
         busy_filter.overwhelmed.connect(view_.spoken)
         tool_context.env_hovered.connect(view_.spoken)
 
+        app.aboutToQuit.connect(state.flush)
+
         self._app = app
         self._ctrl = ctrl
         self._view = view_
@@ -201,6 +207,7 @@ class Session(object):
 
     def close(self):
         self._app.closeAllWindows()
+        self._state.flush()
         self._app.quit()
 
 
@@ -214,20 +221,30 @@ class State(object):
         :type storage: QtCore.QSettings
         """
         self._storage = storage
+        self._cache = dict()  # full key -> raw value, saves ini file stats
+        self._pending = dict()  # full key -> value, not yet written
 
-    def _f(self, value):
-        # Account for poor serialisation format
-        true = ["2", "1", "true", True, 1, 2]
-        false = ["0", "false", False, 0]
+        # coalesce writes, flushed shortly after the last store or on quit
+        self._flush_timer = QtCore.QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(2000)
+        self._flush_timer.timeout.connect(self.flush)
 
-        if value in true:
-            value = True
+    def _full_key(self, key):
+        group = self._storage.group()
+        return f"{group}/{key}" if group else key
 
-        if value in false:
-            value = False
+    def _f(self, value):
+        # Account for poor serialisation format, only strings need coercion
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
 
-        if value and str(value).isnumeric():
-            value = float(value)
+        if isinstance(value, str):
+            if value in _TRUE_STR:
+                return True
+            if value in _FALSE_STR:
+                return False
+            return float(value) if value.isnumeric() else value
 
         return value
 
@@ -243,10 +260,35 @@ class State(object):
         return self._storage.isWritable()
 
     def store(self, key, value):
-        self._storage.setValue(key, value)
+        full_key = self._full_key(key)
+        self._cache[full_key] = value
+        self._pending[full_key] = value
+        self._flush_timer.start()
+
+    def flush(self):
+        """Write pending values into storage"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        if self._storage.group():
+            # pending keys are full keys, write them from root group only
+            self._flush_timer.start()
+            return
+        pending, self._pending = self._pending, dict()
+        for full_key, value in pending.items():
+            self._storage.setValue(full_key, value)
+        self._storage.sync()
+
+    def _contains(self, key):
+        return (self._full_key(key) in self._pending
+                or self._storage.contains(key))
 
     def retrieve(self, key, default=None):
-        value = self._storage.value(key)
+        full_key = self._full_key(key)
+        try:
+            value = self._cache[full_key]
+        except KeyError:
+            value = self._cache[full_key] = self._storage.value(key)
         if value is None:
             value = default
         return self._f(value)
@@ -291,13 +333,13 @@ class State(object):
         # type: (QtWidgets.QWidget, str, bool) -> None
         self._storage.beginGroup(group)
 
-        keys = self._storage.allKeys()
+        contains = self._contains
 
-        if not keep_geo and "geometry" in keys:
+        if not keep_geo and contains("geometry"):
             widget.restoreGeometry(self.retrieve("geometry"))
-        if "state" in keys and hasattr(widget, "restoreState"):
+        if contains("state") and hasattr(widget, "restoreState"):
             widget.restoreState(self.retrieve("state"))
-        if "directory" in keys and hasattr(widget, "setDirectory"):
+        if contains("directory") and hasattr(widget, "setDirectory"):
             widget.setDirectory(self.retrieve("directory"))
 
         self._storage.endGroup()
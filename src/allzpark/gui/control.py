@@ -1,8 +1,10 @@
 
 import os
+import sys
 import time
+import codecs
 import logging
-import inspect
+import selectors
 import traceback
 import functools
 import threading
@@ -28,29 +30,11 @@ def _defer(on_time=500):
     def decorator(func):
         @functools.wraps(func)
         def decorated(*args, **kwargs):
-            self = args[0]
-            fn_name = func.__name__
-            self._sender[fn_name] = QtCore.QObject.sender(self)  # real sender
-            if fn_name not in self._timers:
-                # init timer
-                d = {
-                    "timer": QtCore.QTimer(self),
-                    "args": tuple(),
-                    "kwargs": dict(),
-                }
-                self._timers[fn_name] = d
-
-                def on_timeout():
-                    func(*d["args"], **d["kwargs"])
-                    self._sender.pop(fn_name, None)  # cleanup
-
-                d["timer"].timeout.connect(on_timeout)
-                d["timer"].setSingleShot(True)
-
-            d = self._timers[fn_name]
-            d["args"] = args
-            d["kwargs"] = kwargs
-            d["timer"].start(kwargs.get("on_time") or on_time)
+            self = args[0]  # type: Controller
+            due = time.monotonic() + (kwargs.get("on_time") or on_time) / 1000
+            # replacing drops earlier call, only the latest call runs
+            self._pending[func.__name__] = (due, func, args, kwargs)
+            self._schedule_deferred()
 
         return decorated
 
@@ -73,7 +57,7 @@ def _thread(name, blocks=None):
             fn_name = func.__name__
 
             if name not in self._thread:
-                thread = Thread(self)
+                thread = Thread(name, self)
                 _app = QtWidgets.QApplication.instance()
                 _app.aboutToQuit.connect(thread.on_app_quit)
                 self._thread[name] = thread
@@ -85,24 +69,15 @@ def _thread(name, blocks=None):
                 )
                 return
 
-            blocks_ = blocks or []
             busy_widgets = [
-                w for w in BusyWidget.instances() if w.objectName() in blocks_
+                w for n in blocks or () for w in BusyWidget.by_name(n)
             ]  # type: list[BusyWidget]
 
             for widget in busy_widgets:
                 widget.set_overwhelmed(name)
 
-            def on_finished():
-                for w in busy_widgets:
-                    w.pop_overwhelmed(name)
-                thread.finished.disconnect(on_finished)
-                log.debug(f"Thread {name!r} finished {fn_name!r}.")
-
-            thread.finished.connect(on_finished)
-
-            log.debug(f"Thread {name!r} is about to run {fn_name!r}.")
-            thread.set_job(func, *args, **kwargs)
+            log.debug("Thread %r is about to run %r.", name, fn_name)
+            thread.set_job(busy_widgets, func, *args, **kwargs)
             thread.start()
 
         return decorated
@@ -137,15 +112,30 @@ class Controller(QtCore.QObject):
 
         self._cwd = None
         self._env = None
+        self._base_env = dict(os.environ)
         self._backend_entrances = dict(backends)
-        self._timers = dict()
-        self._sender = dict()
         self._thread = dict()  # type: dict[str, Thread]
 
-    def sender(self):
-        """Internal use. To preserve real signal sender for decorated method."""
-        f = inspect.stack()[1].function
-        return self._sender.pop(f, super(Controller, self).sender())
+        # deferred calls, fn name -> (due time, func, args, kwargs)
+        self._pending = dict()
+        self._defer_timer = QtCore.QTimer(self)
+        self._defer_timer.setSingleShot(True)
+        self._defer_timer.timeout.connect(self._fire_deferred)
+
+    def _schedule_deferred(self):
+        """Internal use. Restart shared timer for the earliest deferred call"""
+        if self._pending:
+            due = min(pending[0] for pending in self._pending.values())
+            msec = int((due - time.monotonic()) * 1000) + 1
+            self._defer_timer.start(max(0, msec))
+
+    def _fire_deferred(self):
+        """Internal use. Run deferred calls that are due"""
+        now = time.monotonic()
+        for fn_name in [n for n, p in self._pending.items() if p[0] <= now]:
+            _, func, args, kwargs = self._pending.pop(fn_name)
+            func(*args, **kwargs)
+        self._schedule_deferred()
 
     @QtCore.Slot(str)  # noqa
     @_defer(on_time=250)
@@ -206,12 +196,12 @@ class Controller(QtCore.QObject):
         if error_occurred:
             self.list_scopes.cache_clear()
 
-        self.workspace_updated.emit(child_scopes)
+        self.workspace_updated.emit(list(child_scopes))
 
     @_thread(name="tools", blocks=("ProductionPage",))
     def update_tools(self, scope):
         work_dir = scope.obtain_workspace()
-        self.tools_updated.emit(core.list_tools(scope))
+        self.tools_updated.emit(list(core.list_tools(scope)))
         self.work_dir_obtained.emit(work_dir or "")
         self._cwd = work_dir
         self._env = None
@@ -231,57 +221,65 @@ class Controller(QtCore.QObject):
 
         self.history_updated.emit(valid_history, parsed_tools)
 
-    @functools.lru_cache(maxsize=None)
+    @functools.lru_cache(maxsize=64)
     def list_scopes(self, scope):
         _error = False
         _start = time.time()
         children = []
-        log.info(f"Pulling sub-workspaces from {scope.name}")
+        log.info("Pulling sub-workspaces from %s", scope.name)
         try:
             for i, child in enumerate(scope.iter_children()):
                 children.append(child)
-                self.status_message.emit(
-                    f"Pulling{'.' * (int(i / 2) % 5): <5} {child.name}", 5000
-                )
+                if not i & 31:  # throttled, every 32 children
+                    dots = "." * ((i >> 5) % 5)
+                    self.status_message.emit(
+                        f"Pulling{dots: <5} {child.name}", 5000
+                    )
         except Exception as e:
             log.error(traceback.format_exc())
             log.error(str(e))
             _error = True
 
         if not _error:
-            log.info(f"Workspace {scope.name} updated in "
-                     f"{time.time() - _start:.2f} secs. "
-                     f"({len(children)} pulled)")
+            log.info("Workspace %s updated in %.2f secs. (%d pulled)",
+                     scope.name, time.time() - _start, len(children))
 
-        return _error, children
+        return _error, tuple(children)
 
     def select_tool(self, suite_tool: core.SuiteTool):
         work_dir = suite_tool.scope.obtain_workspace(suite_tool)
         work_env = suite_tool.scope.additional_env(suite_tool)
         self.work_dir_obtained.emit(work_dir or "")
-        self.tool_selected.emit(suite_tool, work_env or {})
+        self.tool_selected.emit(suite_tool, dict(work_env or {}))
         self._cwd = work_dir
         self._env = work_env
 
     def cache_clear(self):
         core.cache_clear()
+        for entrance in self._backend_entrances.values():
+            if callable(getattr(entrance, "cache_clear", None)):
+                entrance.cache_clear()
         self.list_scopes.cache_clear()
+        self.refresh_env()
         self.cache_cleared.emit()
         log.debug("Internal cache cleared.")
 
+    def refresh_env(self):
+        """Re-snapshot current process environment for launching tools"""
+        self._base_env = dict(os.environ)
+
     def launch(self, tool: core.SuiteTool, shell=False):
         # todo: check tool.scope existence
         env = None
         if self._env:
-            env = os.environ.copy()
+            env = self._base_env.copy()
             env.update(self._env)
 
-        if not os.path.isdir(self._cwd):
-            try:
-                os.makedirs(self._cwd)
-            except Exception as e:
-                log.critical(str(e))
-                return
+        try:
+            os.makedirs(self._cwd, exist_ok=True)
+        except Exception as e:
+            log.critical(str(e))
+            return
 
         if shell:
             self._launch_shell(tool, env)
@@ -289,7 +287,7 @@ class Controller(QtCore.QObject):
             self._launch_tool(tool, env)
 
     def _launch_shell(self, suite_tool: core.SuiteTool, env=None):
-        log.info(f"Launching {suite_tool.name} shell...")
+        log.info("Launching %s shell...", suite_tool.name)
 
         suite_tool.context.execute_shell(
             command=None,
@@ -300,7 +298,7 @@ class Controller(QtCore.QObject):
         )
 
     def _launch_tool(self, suite_tool: core.SuiteTool, env=None):
-        log.info(f"Launching {suite_tool.name}")
+        log.info("Launching %s", suite_tool.name)
 
         cmd = Command(
             context=suite_tool.context,
@@ -404,6 +402,13 @@ class Command(QtCore.QObject):
         if self.start_new_session:
             return
 
+        if sys.platform != "win32":
+            # selectors doesn't support pipes on Windows
+            thread = threading.Thread(target=self.listen)
+            thread.daemon = True
+            thread.start()
+            return
+
         for target in (self.listen_on_stdout,
                        self.listen_on_stderr):
             thread = threading.Thread(target=target)
@@ -418,6 +423,64 @@ class Command(QtCore.QObject):
         # is currently running.
         return self._running
 
+    def listen(self, batch_size=16, interval=0.05):
+        """Read both stdout and stderr in one thread, emit lines in batch
+
+        Lines are joined by newline and emitted once `batch_size` lines are
+        collected or `interval` seconds passed. POSIX only.
+
+        """
+        encoding = util.subprocess_encoding()
+        errors = util.unicode_decode_error_handler()
+        streams = dict()  # fd -> [signal, decoder, partial line, lines]
+
+        sel = selectors.DefaultSelector()
+        for pipe, signal in ((self.popen.stdout, self.stdout),
+                             (self.popen.stderr, self.stderr)):
+            fd = pipe.fileno()
+            decoder = codecs.getincrementaldecoder(encoding)(errors)
+            streams[fd] = [signal, decoder, "", []]
+            sel.register(fd, selectors.EVENT_READ)
+
+        def flush():
+            for _signal, _, _, _lines in streams.values():
+                if _lines:
+                    _signal.emit("\n".join(_lines))
+                    _lines.clear()
+
+        self._running = True
+        last_flush = time.monotonic()
+        while sel.get_map():
+            for key, _ in sel.select(timeout=interval):
+                stream = streams[key.fd]
+                _, decoder, partial, lines = stream
+                data = os.read(key.fd, 65536)
+                if data:
+                    text = partial + decoder.decode(data)
+                else:
+                    sel.unregister(key.fd)  # EOF
+                    text = partial + decoder.decode(b"", final=True)
+
+                chunks = text.splitlines(keepends=True)
+                if data and chunks and not chunks[-1].endswith("\n"):
+                    stream[2] = chunks.pop()  # wait for the rest of line
+                else:
+                    stream[2] = ""
+                lines.extend(chunk.rstrip() for chunk in chunks)
+
+                if len(lines) >= batch_size:
+                    stream[0].emit("\n".join(lines))
+                    lines.clear()
+
+            if time.monotonic() - last_flush >= interval:
+                flush()
+                last_flush = time.monotonic()
+
+        flush()
+        sel.close()
+        self._running = False
+        self.killed.emit()
+
     def listen_on_stdout(self):
         self._running = True
         for line in iter(self.popen.stdout.readline, ""):
@@ -431,28 +494,39 @@ class Command(QtCore.QObject):
 
 
 class Thread(QtCore.QThread):
+    # emitted with the job that has just run, so each job releases its own
+    # busy widgets even if the next job is started before this arrives
+    job_finished = QtCore.Signal(object)
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, name, *args, **kwargs):
         super(Thread, self).__init__(*args, **kwargs)
-        self._func = None
-        self._args = None
-        self._kwargs = None
+        self._name = name
+        self._job = None
+        self.job_finished.connect(self._on_job_finished)
+
+    def _on_job_finished(self, job):
+        busy_widgets, func, _, _ = job
+        for widget in busy_widgets:
+            widget.pop_overwhelmed(self._name)
+        log.debug("Thread %r finished %r.", self._name, func.__name__)
 
     def on_app_quit(self):
         self.requestInterruption()
         self.wait()
 
-    def set_job(self, func, *args, **kwargs):
-        self._func = func
-        self._args = args
-        self._kwargs = kwargs
+    def set_job(self, busy_widgets, func, *args, **kwargs):
+        self._job = (list(busy_widgets), func, args, kwargs)
 
     def run(self):
+        job = self._job
+        _, func, args, kwargs = job
         try:
-            self._func(*self._args, **self._kwargs)
+            func(*args, **kwargs)
         except Exception as e:
             message = f"\n{traceback.format_exc()}\n{str(e)}"
             log.critical(message)
+        finally:
+            self.job_finished.emit(job)
 
 
 # https://docs.python.org/3/howto/logging-cookbook.html#a-qt-gui-for-logging
@@ -460,7 +534,33 @@ class QtStatusBarHandler(logging.Handler):
     def __init__(self, ctrl, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._ctrl = ctrl
+        self._last = None
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+        # coalesce log floods, only the most severe message in a tick is
+        # sent, the latest one if there are several of the same level
+        self._timer = QtCore.QTimer(ctrl)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(50)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def _on_timeout(self):
+        with self._lock:
+            last, self._last = self._last, None
+            self._scheduled = False
+        if last is not None:
+            self._ctrl.status_message.emit(last[1], 5000)
 
     def emit(self, record):
         s = self.format(record)
-        self._ctrl.status_message.emit(s, 5000)
+        with self._lock:
+            if self._last is None or record.levelno >= self._last[0]:
+                self._last = (record.levelno, s)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        # may be called from worker thread, start timer in its own thread
+        QtCore.QMetaObject.invokeMethod(
+            self._timer, "start", QtCore.Qt.QueuedConnection
+        )
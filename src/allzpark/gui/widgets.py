@@ -1,6 +1,7 @@
 
 import json
 import logging
+import functools
 import traceback
 from typing import List
 from ._vendor.Qt5 import QtCore, QtGui, QtWidgets
@@ -81,18 +82,52 @@ class BusyWidget(QtWidgets.QWidget):
     better.
     """
     _instances = []
+    _by_name = dict()  # type: dict[str, list[BusyWidget]]
 
     def __init__(self, *args, **kwargs):
         super(BusyWidget, self).__init__(*args, **kwargs)
         self._busy_works = set()
         self._entered = False
         self._filter = BusyEventFilterSingleton(self)
+        self._name = self.objectName()
         self._instances.append(self)
+        self._by_name.setdefault(self._name, []).append(self)
+        self.objectNameChanged.connect(self._on_object_name_changed)
+        # note: don't touch the widget in there, C++ object is gone by then
+        self.destroyed.connect(functools.partial(BusyWidget._forget, self))
+
+    @classmethod
+    def _unindex(cls, widget, name):
+        widgets = cls._by_name.get(name)
+        if widgets is None:
+            return
+        widgets[:] = [w for w in widgets if w is not widget]
+        if not widgets:
+            del cls._by_name[name]
+
+    @classmethod
+    def _forget(cls, widget, *_):
+        cls._instances[:] = [w for w in cls._instances if w is not widget]
+        for name in list(cls._by_name):
+            cls._unindex(widget, name)
+
+    @QtCore.Slot(str)  # noqa
+    def _on_object_name_changed(self, name):
+        self._unindex(self, self._name)
+        self._name = name
+        self._by_name.setdefault(name, []).append(self)
 
     @classmethod
     def instances(cls):
         return cls._instances[:]
 
+    @classmethod
+    def by_name(cls, name):
+        """Returns BusyWidget instances that have given object name
+        :rtype: list[BusyWidget]
+        """
+        return cls._by_name.get(name, [])[:]
+
     @QtCore.Slot(str)  # noqa
     def set_overwhelmed(self, worker: str):
         if not self._busy_works:
@@ -265,6 +300,7 @@ class WorkspaceWidget(BusyWidget):
         # possibly need to do some cleanup before/after signal emitted ?
         self.backend_changed.emit(name)
 
+    @QtCore.Slot(core.AbstractScope)  # noqa
     def on_workspace_entered(self, scope):
         backend_changed = False
         if scope.upstream is None:  # is entrance object, backend changed
@@ -280,10 +316,12 @@ class WorkspaceWidget(BusyWidget):
         widget = self._stack.currentWidget()
         widget.enter_workspace(scope, backend_changed)
 
+    @QtCore.Slot(list)  # noqa
     def on_workspace_updated(self, scopes):
         widget = self._stack.currentWidget()
         widget.update_workspace(scopes)
 
+    @QtCore.Slot()  # noqa
     def on_cache_cleared(self):
         widget = self._stack.currentWidget()
         widget.on_cache_cleared()
@@ -365,9 +403,11 @@ class ToolsView(QtWidgets.QWidget):
         if index.isValid():
             self.tool_launched.emit()
 
+    @QtCore.Slot(list)  # noqa
     def on_tools_updated(self, tools):
         self._model.update_tools(tools)
 
+    @QtCore.Slot()  # noqa
     def on_cache_cleared(self):
         self._view.clearSelection()
 
@@ -472,9 +512,11 @@ class WorkDirWidget(QtWidgets.QWidget):
 
         self._line = line
 
+    @QtCore.Slot(str)  # noqa
     def on_work_dir_obtained(self, path):
         self._line.setText(path)
 
+    @QtCore.Slot()  # noqa
     def on_work_dir_resetted(self):
         self._line.setText("")
 
@@ -544,6 +586,7 @@ class ToolContextWidget(QtWidgets.QWidget):
                 lib.ContextEnvInspector.inspect(context)
             )
 
+    @QtCore.Slot()  # noqa
     def on_tool_cleared(self):
         self._context.reset()
         self._environ.model().clear()
@@ -756,6 +799,7 @@ class ToolLaunchWidget(QtWidgets.QWidget):
 
         self.tool_changed.emit(self._tool)
 
+    @QtCore.Slot()  # noqa
     def launch_tool(self):
         self.tool_launched.emit(self._tool)
         self._unlock_launch_btn(False)
@@ -1,8 +1,11 @@
 
 import os
 import json
+import atexit
 import getpass
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import singledispatch, update_wrapper
 
@@ -115,6 +118,72 @@ def get_user_task():
     with open(db, "rb") as f:
         user_docs = json.load(f)
 
-    user = getpass.getuser().lower()
+    user = current_user().lower()
     task = user_docs.get(user, {}).get('task', '')
     return task
+
+
+_current_user = getpass.getuser()
+
+
+def current_user():
+    """Returns current user name, read once and cached"""
+    return _current_user
+
+
+def refresh_current_user():
+    """Re-read current user name, e.g. after process changed its identity"""
+    global _current_user
+    _current_user = getpass.getuser()
+    return _current_user
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Returns the thread pool shared by suite loading and backend queries
+
+    Tasks submitted to this pool must not wait on other tasks of the same
+    pool, or they may starve each other.
+
+    :rtype: ThreadPoolExecutor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix="allzpark"
+                )
+    return _executor
+
+
+class SharedConnections(object):
+    """Thread-safe registry of shared connections, closed at exit
+
+    :param connect: Function that takes a key and returns a new connection
+    :param close: Function that takes a connection and closes it
+    """
+
+    def __init__(self, connect, close):
+        self._connect = connect
+        self._close = close
+        self._conns = dict()
+        self._lock = threading.Lock()
+        atexit.register(self.close_all)
+
+    def get(self, key):
+        with self._lock:
+            conn = self._conns.get(key)
+            if conn is None:
+                conn = self._conns[key] = self._connect(key)
+        return conn
+
+    def close_all(self):
+        with self._lock:
+            conns = list(self._conns.values())
+            self._conns.clear()
+        for conn in conns:
+            self._close(conn)
@@ -0,0 +1,222 @@
+import unittest
+from unittest import mock
+
+try:
+    from bson.objectid import ObjectId
+    from pymongo.errors import OperationFailure
+    from allzpark import backend_avalon
+except ImportError as e:
+    raise unittest.SkipTest(f"Avalon backend not available: {e}")
+
+
+_ID = dict()
+
+
+def _asset_doc(name, _type, silo, label, tasks=None, parent=None):
+    _id = _ID.setdefault(name, ObjectId())
+    data = {"label": label}
+    if tasks:
+        data["tasks"] = tasks
+    if parent:
+        data["visualParent"] = _ID.setdefault(parent, ObjectId())
+    return {"_id": _id, "type": _type, "name": name, "silo": silo,
+            "data": data}
+
+
+_ASSET_DOCS = [
+    _asset_doc("char", "asset_type", "Assets", "Character", ["rig"]),
+    _asset_doc("hero", "asset", "Assets", "Hero", ["model"], "char"),
+    _asset_doc("villain", "asset", "Assets", "Villain", ["look"], "char"),
+    _asset_doc("orphan", "asset", "Assets", "Orphan", parent="deleted"),
+    _asset_doc("ep01", "episode", "Shots", "ep01"),
+    _asset_doc("sq01", "sequence", "Shots", "sq01", parent="ep01"),
+    _asset_doc("sh010", "asset", "Shots", "sh010", ["anim"], "sq01"),
+]
+_SILO_DOCS = [
+    {"_id": "s1", "type": "silo", "name": "Assets", "data": {}},
+    {"_id": "s2", "type": "silo", "name": "Shots", "data": {"trash": True}},
+    {"_id": "s3", "type": "silo", "name": "Shots", "data": {}},  # duplicated
+]
+_PROJECT_DOC = {
+    "type": "project",
+    "name": "proj",
+    "data": {"root": "/projects", "role": {"member": ["user"]}},
+    "config": {"tasks": [{"name": "model"}, {"name": "rig"}],
+               "template": {"work": "{root}/{project}"}},
+}
+
+
+class TestAvalonBase(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(backend_avalon, "_get_connection")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.entrance = backend_avalon.Entrance(
+            uri="mongodb://localhost", timeout=10, joined=True
+        )
+        self.db = self.entrance.db
+        self.coll = mock.MagicMock()
+        self.coll.find.return_value.batch_size.return_value = \
+            _ASSET_DOCS + _SILO_DOCS
+        self.db._colls["proj"] = self.coll
+
+
+class TestListAssets(TestAvalonBase):
+
+    def test_bucket_by_parent(self):
+        """Test assets are bucketed by visual parent or silo"""
+        children, silos = self.db.list_assets("proj")
+
+        def names(key):
+            return [d["name"] for d in children[key]]
+
+        self.assertEqual(["orphan", "char"], names("Assets"))
+        self.assertEqual(["ep01"], names("Shots"))
+        self.assertEqual(["hero", "villain"], names(_ID["char"]))
+        self.assertEqual(["sq01"], names(_ID["ep01"]))
+        self.assertEqual(["sh010"], names(_ID["sq01"]))
+
+    def test_silo_hidden(self):
+        """Test silo hidden state comes from the first silo doc"""
+        _, silos = self.db.list_assets("proj")
+        self.assertEqual({"Assets": False, "Shots": True}, silos)
+
+    def test_iter_assets_breadth_first(self):
+        """Test assets are iterated breadth first, silos first"""
+        project = backend_avalon._mk_project_scope("proj", _PROJECT_DOC,
+                                                   self.db)
+        assets = list(backend_avalon.iter_avalon_assets(project))
+
+        self.assertEqual(
+            ["Assets", "Shots", "orphan", "char", "ep01",
+             "hero", "villain", "sq01", "sh010"],
+            [a.name for a in assets]
+        )
+        by_name = {a.name: a for a in assets}
+        self.assertTrue(by_name["Assets"].is_silo)
+        self.assertTrue(by_name["sh010"].is_hidden)  # silo is trashed
+        self.assertFalse(by_name["hero"].is_hidden)
+        self.assertEqual("ep01", by_name["sh010"].episode)
+        self.assertEqual("sq01", by_name["sh010"].sequence)
+        self.assertIs(by_name["char"], by_name["hero"].parent)
+        self.assertFalse(by_name["char"].is_leaf)
+        self.assertTrue(by_name["hero"].is_leaf)
+        self.assertEqual({"model", "look"}, by_name["char"].child_task)
+
+
+class TestBreadcrumb(TestAvalonBase):
+
+    def setUp(self):
+        super(TestBreadcrumb, self).setUp()
+        docs = {d["_id"]: d for d in _ASSET_DOCS}
+        silo_hidden = {"Assets": False, "Shots": True}
+
+        db = self.db
+        db.find_project = mock.Mock(return_value=_PROJECT_DOC)
+        db.find_asset_doc = mock.Mock(side_effect=lambda _, name: next(
+            (d for d in _ASSET_DOCS if d["name"] == name), None
+        ))
+        db.find_visual_parent = mock.Mock(side_effect=lambda _, doc: docs.get(
+            doc["data"].get("visualParent")
+        ))
+        db.find_child_asset_docs = mock.Mock(side_effect=lambda _, _id: [
+            d for d in _ASSET_DOCS if d["data"].get("visualParent") == _id
+        ])
+        db.get_silo_hidden = mock.Mock(side_effect=lambda _, name: (
+            silo_hidden.get(name, False)
+        ))
+        db.list_assets = mock.Mock(wraps=db.list_assets)
+
+    def lookup(self, **breadcrumb):
+        breadcrumb.update({"entrance": "avalon", "project": "proj"})
+        return self.entrance.get_scope_from_breadcrumb(breadcrumb)
+
+    def test_task(self):
+        """Test getting task scope by walking visual parents only"""
+        task = self.lookup(asset="hero", task="model")
+
+        self.assertIsInstance(task, backend_avalon.Task)
+        self.assertEqual("model", task.name)
+        self.assertEqual("hero", task.asset.name)
+        self.assertEqual("char", task.asset.parent.name)
+        self.assertTrue(task.asset.parent.parent.is_silo)
+        self.db.list_assets.assert_not_called()
+
+    def test_asset_children(self):
+        """Test asset leaf state and child tasks match the full scan"""
+        asset = self.lookup(asset="char")
+        scanned = next(
+            # child states are set while children being iterated
+            a for a in list(backend_avalon.iter_avalon_assets(asset.project))
+            if a.name == "char"
+        )
+        self.assertFalse(asset.is_leaf)
+        self.assertEqual(scanned.is_leaf, asset.is_leaf)
+        self.assertEqual(scanned.child_task, asset.child_task)
+
+    def test_asset_not_found(self):
+        """Test missing asset returns early without scanning hierarchy"""
+        self.assertIsNone(self.lookup(asset="nobody"))
+        self.db.list_assets.assert_not_called()
+
+    def test_hidden_asset(self):
+        """Test asset under trashed silo is not returned"""
+        self.assertIsNone(self.lookup(asset="sh010"))
+
+    def test_unresolvable_parents(self):
+        """Test falling back to hierarchy scan if parent chain is broken"""
+        self.db.find_visual_parent.side_effect = lambda _, doc: doc  # cyclic
+        asset = self.lookup(asset="hero")
+        self.assertEqual("hero", asset.name)
+        self.assertEqual("char", asset.parent.name)
+        self.db.list_assets.assert_called_once_with("proj")
+
+    def test_task_not_assigned(self):
+        self.assertIsNone(self.lookup(asset="hero", task="anim"))
+
+
+class TestIterProjects(TestAvalonBase):
+
+    def setUp(self):
+        super(TestIterProjects, self).setUp()
+        self.docs = {
+            "a": dict(_PROJECT_DOC, name="a"),
+            "b": None,  # not a project collection, or not joined
+            "c": dict(_PROJECT_DOC, name="c"),
+        }
+        self.db._db.list_collection_names.return_value = ["c", "b", "a"]
+        self.db.find_project = mock.Mock(
+            side_effect=lambda name, **_: self.docs[name]
+        )
+
+    def test_union_with(self):
+        """Test projects are found with one $unionWith aggregation"""
+        union = [dict(d, _coll=n) for n, d in self.docs.items() if d]
+        self.coll.aggregate.return_value = iter(union)
+        self.db._colls["a"] = self.coll
+
+        projects = list(self.db.iter_projects())
+
+        self.assertEqual(["a", "c"], [name for name, _ in projects])
+        self.coll.aggregate.assert_called_once()
+        self.db.find_project.assert_not_called()
+        self.assertTrue(self.db._union_supported)
+
+    def test_union_with_fallback(self):
+        """Test falling back to per-collection query on old MongoDB"""
+        self.coll.aggregate.side_effect = OperationFailure(
+            "Unrecognized pipeline stage name: '$unionWith'"
+        )
+        self.db._colls["a"] = self.coll
+
+        projects = list(self.db.iter_projects())
+        self.assertEqual(["a", "c"], [name for name, _ in projects])
+        self.assertEqual(self.docs["a"], projects[0][1])
+        self.assertFalse(self.db._union_supported)
+
+        # not trying aggregation again
+        list(self.db.iter_projects())
+        self.coll.aggregate.assert_called_once()
+        self.assertEqual(6, self.db.find_project.call_count)
@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from allzpark import backend_sg_sync
+except ImportError as e:
+    raise unittest.SkipTest(f"ShotGrid backend not available: {e}")
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.path = os.path.join(self.root, "cache", "sg_cache.db")
+        self.cache = self.open()
+        self.loader = mock.Mock(return_value=[{"id": 1, "code": "proj"}])
+
+    def open(self):
+        cache = backend_sg_sync._DiskCache(path=self.path, ttl=60)
+        self.addCleanup(lambda: cache._conn and cache._conn.close())
+        return cache
+
+    def fetch(self, namespace="https://sg", cache=None):
+        return (cache or self.cache).fetch(namespace, self.loader)
+
+    def test_fetch_cached(self):
+        """Test value is loaded once and then read from disk"""
+        self.assertEqual(self.loader.return_value, self.fetch())
+        self.assertEqual(self.loader.return_value, self.fetch())
+        self.assertEqual(self.loader.return_value, self.fetch(
+            cache=self.open()  # e.g. next session
+        ))
+        self.loader.assert_called_once()
+
+    def test_fetch_expired(self):
+        """Test value is loaded again after ttl"""
+        now = backend_sg_sync.time.time()
+        with mock.patch.object(backend_sg_sync.time, "time") as time:
+            time.return_value = now
+            self.fetch()
+            time.return_value = now + 59
+            self.fetch()
+            self.loader.assert_called_once()
+
+            time.return_value = now + 61
+            self.fetch()
+            self.assertEqual(2, self.loader.call_count)
+
+    def test_expired_dropped_on_open(self):
+        now = backend_sg_sync.time.time()
+        with mock.patch.object(backend_sg_sync.time, "time") as time:
+            time.return_value = now
+            self.fetch()
+            time.return_value = now + 61
+            cache = self.open()
+            cache.fetch("https://other", self.loader)
+
+        count = cache._conn.execute("SELECT COUNT(*) FROM listing")
+        self.assertEqual(1, count.fetchone()[0])
+
+    def test_invalidate(self):
+        """Test invalidating one namespace doesn't affect others"""
+        self.fetch(namespace="https://a")
+        self.fetch(namespace="https://b")
+        self.assertEqual(2, self.loader.call_count)
+
+        self.cache.invalidate("https://a")
+        self.fetch(namespace="https://a")
+        self.fetch(namespace="https://b")
+        self.assertEqual(3, self.loader.call_count)
+
+    def test_broken_storage(self):
+        """Test storage error is treated as cache miss"""
+        # a directory in place of the database file
+        os.makedirs(self.path)
+        self.assertEqual(self.loader.return_value, self.fetch())
+        self.assertEqual(self.loader.return_value, self.fetch())
+        self.assertEqual(2, self.loader.call_count)
+
+    def test_not_serializable(self):
+        """Test value that can't be stored is still returned"""
+        self.loader.return_value = {object()}
+        self.assertIs(self.loader.return_value, self.fetch())
+
+
+class TestValidProjects(unittest.TestCase):
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        cache = backend_sg_sync._DiskCache(
+            path=os.path.join(root, "sg_cache.db"), ttl=60
+        )
+        patcher = mock.patch.object(backend_sg_sync, "_disk_cache", cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with mock.patch.object(backend_sg_sync, "Shotgun"):
+            self.server = backend_sg_sync.ShotGridConn(
+                "https://sg", "script", "key"
+            )
+        self.server.conn.find.return_value = [
+            {"id": 1, "name": "Foo"},
+            {"id": 2, "name": "Test Bar"},
+        ]
+
+    def test_listing_cached(self):
+        """Test the filtered listing is cached as a whole"""
+        expected = [{"id": 1, "name": "Foo"}]
+        self.assertEqual(expected, list(self.server.iter_valid_projects()))
+        self.assertEqual(expected, list(self.server.iter_valid_projects()))
+        self.server.conn.find.assert_called_once()
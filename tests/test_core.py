@@ -0,0 +1,153 @@
+import weakref
+import unittest
+import dataclasses
+from unittest import mock
+from types import SimpleNamespace
+
+try:
+    from allzpark import core
+except ImportError as e:
+    raise unittest.SkipTest(f"allzpark.core not available: {e}")
+
+
+class TestToolFromBreadcrumb(unittest.TestCase):
+
+    def setUp(self):
+        core._alias_index.cache_clear()
+        self.addCleanup(core._alias_index.cache_clear)
+
+        self.scope = object()
+        self.tools = (
+            SimpleNamespace(alias="maya", name="maya-2022"),
+            SimpleNamespace(alias="houdini", name="houdini"),
+            SimpleNamespace(alias="maya", name="maya-2020"),
+        )
+        self.backend = mock.Mock()
+        self.backend.get_scope_from_breadcrumb.return_value = self.scope
+
+        patcher = mock.patch.object(core, "list_tools",
+                                    return_value=self.tools)
+        self.list_tools = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def lookup(self, **breadcrumb):
+        breadcrumb.setdefault("entrance", "avalon")
+        return core.get_tool_from_breadcrumb(
+            breadcrumb, backends={"avalon": self.backend}
+        )
+
+    def test_first_alias_wins(self):
+        self.assertIs(self.tools[0], self.lookup(tool_alias="maya"))
+        self.assertIs(self.tools[1], self.lookup(tool_alias="houdini"))
+
+    def test_index_built_once_per_scope(self):
+        """Test tools are listed once for all lookups in the same scope"""
+        self.lookup(tool_alias="maya")
+        self.lookup(tool_alias="houdini")
+        self.lookup(tool_alias="nuke")
+        self.list_tools.assert_called_once_with(self.scope, None)
+
+    def test_tool_not_found(self):
+        self.assertIsNone(self.lookup(tool_alias="nuke"))
+
+    def test_scope_not_found(self):
+        self.backend.get_scope_from_breadcrumb.return_value = None
+        self.assertIsNone(self.lookup(tool_alias="maya"))
+        self.list_tools.assert_not_called()
+
+    def test_backend_not_available(self):
+        self.assertIsNone(self.lookup(entrance="sg_sync", tool_alias="maya"))
+        self.backend.get_scope_from_breadcrumb.assert_not_called()
+
+
+class TestSuiteTool(unittest.TestCase):
+
+    def setUp(self):
+        variant = SimpleNamespace(name="maya", _data={
+            "required_roles": ["admin"],
+            "override": {"mayapy": {"label": "Maya Python"}},
+        })
+        self.tool = core.SuiteTool(
+            name="mayapy",
+            alias="mayapy",
+            ctx_name="project.maya",
+            variant=variant,
+            scope=None,
+        )
+
+    def test_derived(self):
+        self.assertEqual("project", self.tool.ctx_category)
+        self.assertEqual("Maya Python", self.tool.metadata.label)
+        self.assertEqual(frozenset({"admin"}),
+                         self.tool.metadata.required_roles)
+
+    def test_frozen(self):
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.tool.alias = "maya"
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            self.tool.undeclared = True
+        self.assertFalse(hasattr(self.tool, "__dict__"))
+
+    def test_weakref(self):
+        self.assertIs(self.tool, weakref.ref(self.tool)())
+        self.assertIs(self.tool.metadata, weakref.ref(self.tool.metadata)())
+
+    def test_bind(self):
+        """Test binding scope keeps derived attributes"""
+        scope = object()
+        bound = self.tool.bind(scope)
+        self.assertIs(scope, bound.scope)
+        self.assertIs(self.tool.metadata, bound.metadata)
+        self.assertEqual(self.tool.ctx_category, bound.ctx_category)
+        self.assertEqual(self.tool, bound.bind(None))
+
+
+class TestRxtCache(unittest.TestCase):
+
+    def setUp(self):
+        core._rxt_cache_clear()
+        self.addCleanup(core._rxt_cache_clear)
+
+        self.loaded = []
+        patcher = mock.patch.object(core.SweetSuite, "context",
+                                    side_effect=self.load, autospec=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(core.os.path, "getmtime", return_value=1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(core, "_rxt_cache_max", 2)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self, suite, name):
+        self.loaded.append(name)
+        return object()
+
+    def suite(self):
+        suite = object.__new__(core.ReadOnlySuite)
+        suite.load_path = "/suite"
+        suite._context = lambda name: {}
+        suite._context_path = lambda name: "/suite/%s.rxt" % name
+        return suite
+
+    def context(self, name):
+        return self.suite().context(name)
+
+    def test_shared(self):
+        """Test loaded context is shared between suite instances"""
+        self.assertIs(self.context("a"), self.context("a"))
+        self.assertEqual(["a"], self.loaded)
+
+    def test_lru(self):
+        """Test least recently used context is evicted"""
+        self.context("a")
+        self.context("b")
+        self.context("a")
+        self.context("c")  # evicts "b"
+        self.context("a")
+        self.assertEqual(["a", "b", "c"], self.loaded)
+        self.context("b")
+        self.assertEqual(["a", "b", "c", "b"], self.loaded)
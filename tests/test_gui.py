@@ -0,0 +1,232 @@
+import os
+import shutil
+import logging
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    from allzpark.gui._vendor.Qt5 import QtCore, QtWidgets
+    from allzpark.gui import app, control, widgets
+except ImportError as e:
+    raise unittest.SkipTest(f"allzpark.gui not available: {e}")
+
+
+def setUpModule():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if QtWidgets.QApplication.instance() is None:
+        global _app
+        _app = QtWidgets.QApplication([])
+
+
+def wait(timeout):
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(timeout, loop.quit)
+    loop.exec_()
+
+
+class TestState(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        self.path = os.path.join(self.root, "preferences.ini")
+        self.state = app.State(self.storage())
+
+    def storage(self):
+        return QtCore.QSettings(self.path, QtCore.QSettings.IniFormat)
+
+    def reloaded(self):
+        return app.State(self.storage())
+
+    def test_store_deferred(self):
+        """Test stored value is readable before written into storage"""
+        self.state.store("theme.on_dark", True)
+        self.assertTrue(self.state.retrieve("theme.on_dark"))
+        self.assertFalse(self.storage().contains("theme.on_dark"))
+
+        self.state.flush()
+        self.assertTrue(self.reloaded().retrieve("theme.on_dark"))
+
+    def test_store_coalesced(self):
+        """Test only the latest value is written on flush"""
+        self.state.store("count", 1)
+        self.state.store("count", 2)
+        self.state.flush()
+        self.assertEqual(2, int(self.storage().value("count")))
+        self.assertFalse(self.state._pending)
+
+    def test_store_in_group(self):
+        """Test values stored in group are flushed under full key"""
+        with self.state.group("layout"):
+            self.state.store("geometry", "100x100")
+            self.state.flush()  # postponed until leaving the group
+            self.assertTrue(self.state._pending)
+            self.assertEqual("100x100", self.state.retrieve("geometry"))
+
+        self.state.flush()
+        self.assertEqual("100x100", self.storage().value("layout/geometry"))
+
+    def test_flush_timer(self):
+        """Test pending values are flushed shortly after the last store"""
+        self.state._flush_timer.setInterval(50)
+        self.state.store("theme.on_dark", False)
+        self.assertFalse(self.storage().contains("theme.on_dark"))
+        wait(150)
+        self.assertIs(False, self.reloaded().retrieve("theme.on_dark"))
+
+
+class Deferred(QtCore.QObject):
+    _schedule_deferred = control.Controller._schedule_deferred
+    _fire_deferred = control.Controller._fire_deferred
+
+    def __init__(self):
+        super(Deferred, self).__init__()
+        self._pending = dict()
+        self._defer_timer = QtCore.QTimer(self)
+        self._defer_timer.setSingleShot(True)
+        self._defer_timer.timeout.connect(self._fire_deferred)
+        self.calls = []
+
+    @control._defer(on_time=50)
+    def on_changed(self, value):
+        self.calls.append(("changed", value))
+
+    @control._defer(on_time=150)
+    def on_selected(self, value):
+        self.calls.append(("selected", value))
+
+
+class TestDefer(unittest.TestCase):
+
+    def test_debounce(self):
+        """Test a burst of calls runs once with the latest arguments"""
+        obj = Deferred()
+        for value in range(5):
+            obj.on_changed(value)
+        self.assertEqual(1, len(obj._pending))
+        self.assertEqual([], obj.calls)
+
+        wait(150)
+        self.assertEqual([("changed", 4)], obj.calls)
+        self.assertFalse(obj._pending)
+
+        obj.on_changed(5)
+        wait(150)
+        self.assertEqual([("changed", 4), ("changed", 5)], obj.calls)
+
+    def test_restart(self):
+        """Test each call postpones the run"""
+        obj = Deferred()
+        obj.on_changed(0)
+        wait(30)
+        obj.on_changed(1)
+        wait(30)
+        self.assertEqual([], obj.calls)
+        wait(100)
+        self.assertEqual([("changed", 1)], obj.calls)
+
+    def test_per_function(self):
+        """Test deferred functions sharing one timer keep their own delay"""
+        obj = Deferred()
+        obj.on_selected(1)
+        obj.on_changed(2)
+        wait(100)
+        self.assertEqual([("changed", 2)], obj.calls)
+        wait(150)
+        self.assertEqual([("changed", 2), ("selected", 1)], obj.calls)
+
+
+class TestBusyWidget(unittest.TestCase):
+
+    def setUp(self):
+        self.widget = widgets.BusyWidget()
+        self.widget.setObjectName("busy.test")
+
+    def tearDown(self):
+        if self.widget is not None:
+            self.delete(self.widget)
+
+    def delete(self, widget):
+        widget.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(
+            None, QtCore.QEvent.DeferredDelete
+        )
+        self.widget = None
+
+    def test_by_name(self):
+        self.assertEqual([self.widget],
+                         widgets.BusyWidget.by_name("busy.test"))
+
+    def test_rename(self):
+        """Test renamed widget is only indexed under its new name"""
+        self.widget.setObjectName("busy.renamed")
+        self.assertEqual([], widgets.BusyWidget.by_name("busy.test"))
+        self.assertNotIn("busy.test", widgets.BusyWidget._by_name)
+        self.assertEqual([self.widget],
+                         widgets.BusyWidget.by_name("busy.renamed"))
+
+    def test_destroyed(self):
+        """Test deleted widget is dropped from the index"""
+        widget = self.widget
+        self.delete(widget)
+        self.assertEqual([], widgets.BusyWidget.by_name("busy.test"))
+        self.assertNotIn(widget, widgets.BusyWidget.instances())
+
+
+class TestThread(unittest.TestCase):
+
+    def setUp(self):
+        self.thread = control.Thread("worker")
+        self.addCleanup(self.thread.wait)
+
+    def run_job(self, busy_widgets):
+        self.thread.set_job(busy_widgets, lambda: None)
+        self.thread.start()
+        self.thread.wait()
+
+    def test_busy_widgets_per_job(self):
+        """Test each finished job releases the widgets it was started with"""
+        first, second = mock.Mock(), mock.Mock()
+        self.run_job([first])
+        # next job started before the previous one's finish is delivered
+        self.run_job([second])
+        first.pop_overwhelmed.assert_not_called()
+
+        QtCore.QCoreApplication.processEvents()
+        first.pop_overwhelmed.assert_called_once_with("worker")
+        second.pop_overwhelmed.assert_called_once_with("worker")
+
+
+class StatusBar(QtCore.QObject):
+    status_message = QtCore.Signal(str, int)
+
+
+class TestStatusBarHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.messages = []
+        self.ctrl = StatusBar()
+        self.ctrl.status_message.connect(
+            lambda message, _: self.messages.append(message)
+        )
+        self.handler = control.QtStatusBarHandler(self.ctrl)
+
+    def log(self, level, message):
+        self.handler.handle(logging.LogRecord(
+            "test", level, __file__, 0, message, None, None
+        ))
+
+    def test_coalesced(self):
+        """Test only the latest message in a tick is shown"""
+        self.log(logging.INFO, "first")
+        self.log(logging.INFO, "second")
+        wait(100)
+        self.assertEqual(["second"], self.messages)
+
+    def test_severity_kept(self):
+        """Test less severe message doesn't overwrite a warning"""
+        self.log(logging.WARNING, "warning")
+        self.log(logging.INFO, "info")
+        wait(100)
+        self.assertEqual(["warning"], self.messages)